@@ -1,13 +1,39 @@
+import logging
+import logging.config
 from contextlib import asynccontextmanager
-from slowapi.errors import RateLimitExceeded
+import anyio.to_thread
 from fastapi import FastAPI, Request
-from starlette.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from src.redis import init_redis, close_redis
+from src.database.db import sessionmanager
+from src.services.rate_limit import RateLimitExceeded
 from src.conf.config import settings
 
 from src.api import utils, contacts, auth, users
 
+LOGGING_CONFIG = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "default": {"format": "%(asctime)s - %(levelname)s - %(message)s"},
+    },
+    "handlers": {
+        "console": {"class": "logging.StreamHandler", "formatter": "default"},
+        # Handlers only enqueue records; formatting and stream I/O happen on
+        # the listener thread so logging never blocks the event loop.
+        "queue": {
+            "class": "logging.handlers.QueueHandler",
+            "handlers": ["console"],
+            "respect_handler_level": True,
+        },
+    },
+    "root": {"level": "INFO", "handlers": ["queue"]},
+}
+
+logging.config.dictConfig(LOGGING_CONFIG)
+log_listener = logging.getHandlerByName("queue").listener
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -15,7 +41,10 @@ async def lifespan(app: FastAPI):
 
     This context manager is used to manage the life cycle of the FastAPI
     application. It is responsible for initializing and closing the Redis
-    connection.
+    connection, for warming up the database connection pool, for running
+    the background log listener and the avatar upload workers, for sizing the
+    worker thread pool and for closing the upload HTTP client and disposing of
+    the database engine.
 
     The lifespan context manager is used as a context manager in the
     FastAPI application, and is automatically called when the application
@@ -27,24 +56,36 @@ async def lifespan(app: FastAPI):
     Yields:
         None
     """
-    app.state.redis_url = settings.REDIS_URL
-    await init_redis(app)
-    yield
-    await close_redis()
+    log_listener.start()
+    try:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+        app.state.redis_url = settings.REDIS_URL
+        await init_redis(app)
+        await sessionmanager.warm_up()
+        await users.get_avatar_queue().start()
+        yield
+    finally:
+        await users.get_avatar_queue().stop()
+        await close_redis()
+        await users.get_upload_service().close()
+        await sessionmanager.close()
+        log_listener.stop()
 
 app = FastAPI(
     title="Rest API Service",
     description="Rest API Service for contacts app",
     version="1.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=settings.ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["authorization", "content-type", "if-none-match"],
+    expose_headers=["etag"],
 )
 
 app.include_router(utils.router, prefix="/api")
@@ -56,8 +97,7 @@ app.include_router(users.router, prefix="/api")
 @app.exception_handler(RateLimitExceeded)
 async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
     """
-    Handles the RateLimitExceeded exception raised by the slowapi
-    rate limiter.
+    Handles the RateLimitExceeded exception raised by the rate limiter.
 
     Returns a JSON response with a 429 status code and an error message.
 
@@ -66,10 +106,10 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
         exc (RateLimitExceeded): The exception raised by the rate limiter.
 
     Returns:
-        JSONResponse: A JSON response with a 429 status code and an error
+        ORJSONResponse: A JSON response with a 429 status code and an error
         message.
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=429,
         content={"error": "Rate limit exceeded, try again later."},
     )
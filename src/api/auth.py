@@ -1,16 +1,20 @@
-import logging, random, string
+import logging, secrets
 
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.security import OAuth2PasswordRequestForm
 from src.schemas import User, UserCreate, Token, TokenRefreshRequest, RequestEmail
 from src.services.users import UserService
 from src.services.auth import (
-    Hash,
+    hasher,
     create_access_token,
     create_refresh_token,
     verify_refresh_token,
-    get_email_from_token
+    verify_password_cached,
+    get_email_from_token,
+    invalidate_cached_user,
 )
 from src.services.email import (
     send_email,
@@ -19,50 +23,19 @@ from src.services.email import (
     send_new_password_email
 )
 from src.database.db import get_db
+from src.redis import get_redis
 
 router = APIRouter(prefix="/auth", tags=["auth"])
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 
-async def check_user_exists(
-    user_service: UserService, email: str, username: str
-) -> None:
-    """
-    Checks if a user with a given email or username already exists in the database.
-
-    Args:
-        user_service (UserService): Service for performing user-related operations.
-        email (str): Email of the user to check.
-        username (str): Username of the user to check.
-
-    Raises:
-        HTTPException: If a user with the given email or username exists.
-
-    Returns:
-        None
-    """
-    email_user = await user_service.get_user_by_email(email)
-    if email_user:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="A user with this email already exists.",
-        )
-
-    username_user = await user_service.get_user_by_username(username)
-    if username_user:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="A user with this username already exists.",
-        )
-
-
 @router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
 async def register_user(
     user_data: UserCreate,
     background_tasks: BackgroundTasks,
     request: Request,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis_client=Depends(get_redis),
 ):
     """
     Registers a new user by creating an account and sending a confirmation email.
@@ -72,6 +45,7 @@ async def register_user(
         background_tasks (BackgroundTasks): Used to manage background operations such as sending emails.
         request (Request): Provides information about the current HTTP request.
         db (AsyncSession): The database session dependency for performing operations.
+        redis_client: Redis client holding the cached user lookups.
 
     Raises:
         HTTPException: If a user with the given email or username already exists.
@@ -80,21 +54,23 @@ async def register_user(
         User: The newly created user object.
     """
     user_service = UserService(db)
-    await check_user_exists(user_service, user_data.email, user_data.username)
-
-    user_data.password = Hash().get_password_hash(user_data.password)
+    user_data.password = await hasher.get_password_hash(user_data.password)
     new_user = await user_service.create_user(user_data)
+    # Drop a cached "user not found" left by tokens probing this username
+    await invalidate_cached_user(redis_client, new_user.username)
     background_tasks.add_task(
         send_email, new_user.email, new_user.username, request.base_url
     )
 
-    logger.info(f"User {new_user.username} registered successfully.")
+    logger.info("User %s registered successfully.", new_user.username)
     return new_user
 
 
 @router.post("/login", response_model=Token)
 async def login_user(
-    form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_db),
+    redis_client=Depends(get_redis),
 ):
     """
     Authenticates a user and returns JWT tokens for authorized access.
@@ -102,6 +78,7 @@ async def login_user(
     Args:
         form_data: OAuth2PasswordRequestForm containing the username and password.
         db: Database session for performing database operations.
+        redis_client: Redis client used to cache successful password checks.
 
     Raises:
         HTTPException: If the username or password is incorrect, or if the email is not confirmed.
@@ -112,8 +89,10 @@ async def login_user(
     user_service = UserService(db)
     user = await user_service.get_user_by_username(form_data.username)
 
-    if not user or not Hash().verify_password(form_data.password, user.hashed_password):
-        logger.warning(f"Failed login attempt for username: {form_data.username}")
+    if not user or not await verify_password_cached(
+        redis_client, user.username, form_data.password, user.hashed_password
+    ):
+        logger.warning("Failed login attempt for username: %s", form_data.username)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid username or password.",
@@ -132,9 +111,12 @@ async def login_user(
 
     # Store the refresh token in the database
     user.refresh_token = refresh_token
+    # Move hashes made with an outdated cost factor to the current one
+    if hasher.needs_update(user.hashed_password):
+        user.hashed_password = await hasher.get_password_hash(form_data.password)
     await db.commit()
     await db.refresh(user)
-    logger.info(f"User {user.username} logged in successfully.")
+    logger.info("User %s logged in successfully.", user.username)
 
     return {
         "access_token": access_token,
@@ -143,8 +125,44 @@ async def login_user(
     }
 
 
-@router.post("/refresh-token", response_model=Token)
-async def new_token(request: TokenRefreshRequest, db: AsyncSession = Depends(get_db)):
+async def parse_token_refresh_request(request: Request) -> TokenRefreshRequest:
+    """
+    Parses the refresh token request body with pydantic-core's JSON parser.
+
+    The raw body is validated in a single pass instead of being decoded with
+    the stdlib json module first and validated afterwards.
+
+    Args:
+        request (Request): The incoming request.
+
+    Raises:
+        RequestValidationError: If the body is not valid JSON or does not match the schema.
+
+    Returns:
+        TokenRefreshRequest: The parsed request body.
+    """
+    try:
+        return TokenRefreshRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
+
+@router.post(
+    "/refresh-token",
+    response_model=Token,
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": TokenRefreshRequest.model_json_schema()}},
+            "required": True,
+        }
+    },
+)
+async def new_token(
+    request: TokenRefreshRequest = Depends(parse_token_refresh_request),
+    db: AsyncSession = Depends(get_db),
+):
     """
     Create new access and refresh token
 
@@ -256,8 +274,8 @@ async def validate_reset_token(
         )
 
     # Generate a new password
-    new_password = ''.join(random.choices(string.ascii_letters + string.digits, k=12))
-    hashed_password = Hash().get_password_hash(new_password)
+    new_password = secrets.token_urlsafe(9)
+    hashed_password = await hasher.get_password_hash(new_password)
 
     # Update password
     await user_service.update_password(email, hashed_password)
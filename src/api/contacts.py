@@ -1,32 +1,38 @@
+import hashlib
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Depends, status, Query
+from fastapi import APIRouter, HTTPException, Depends, status, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import get_db
+from src.redis import get_redis
 from src.schemas import (
     ContactCreate,
     ContactUpdate,
     ContactResponse,
     User
 )
+from src.services.cache import CacheService
 from src.services.contacts import ContactService
 from src.services.auth import get_current_user
 
 router = APIRouter(prefix="/contacts", tags=["contacts"])
 
 
-def get_contact_service(db: AsyncSession = Depends(get_db)) -> ContactService:
+async def get_contact_service(
+    db: AsyncSession = Depends(get_db), redis_client=Depends(get_redis)
+) -> ContactService:
     """
-    Provides a ContactService instance with a database session dependency.
+    Provides a ContactService instance with database session and cache dependencies.
 
     Args:
         db (AsyncSession): The database session provided by dependency injection.
+        redis_client (redis.asyncio.Redis): The Redis client backing the cache.
 
     Returns:
         ContactService: An instance of the ContactService class.
     """
-    return ContactService(db)
+    return ContactService(db, CacheService(redis_client))
 
 
 def ensure_contact_exists(contact):
@@ -49,30 +55,75 @@ def ensure_contact_exists(contact):
     return contact
 
 
+def etag_response(request: Request, payload: bytes) -> Response:
+    """
+    Wraps a serialized JSON payload in a response carrying a weak ETag.
+
+    If the client already holds the same representation (``If-None-Match``
+    matches the ETag), an empty 304 response is returned instead of the body.
+
+    Args:
+        request (Request): The incoming request.
+        payload (bytes): The JSON-encoded response body.
+
+    Returns:
+        Response: A 200 response with the payload, or a 304 response.
+    """
+    etag = f'W/"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(content=payload, media_type="application/json", headers={"ETag": etag})
+
+
 @router.get("/", response_model=List[ContactResponse])
 async def read_contacts(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of contacts to skip"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of contacts to return"),
     name: Optional[str] = Query(None),
     surname: Optional[str] = Query(None),
     email: Optional[str] = Query(None),
+    q: Optional[str] = Query(None, description="Words to search for in name, surname and email"),
+    after_surname: Optional[str] = Query(None, description="Surname of the last contact of the previous page"),
+    after_id: Optional[int] = Query(None, description="ID of the last contact of the previous page"),
     contact_service: ContactService = Depends(get_contact_service),
     user: User = Depends(get_current_user)
 ):
     """
     Retrieves a list of contacts for the user with optional search query and pagination.
 
+    Contacts are ordered by surname and ID. The next page is fetched by passing
+    the surname and ID of the last contact of the current page, which stays fast
+    however deep the page is; ``skip`` is kept for offset pagination.
+
     Args:
+        request (Request): The incoming request, checked for ``If-None-Match``.
         skip (int): The number of contacts to skip.
         limit (int): The maximum number of contacts to return.
         name (Optional[str]): The name to search for.
         surname (Optional[str]): The surname to search for.
         email (Optional[str]): The email to search for.
+        q (Optional[str]): The words to search for in name, surname and email.
+        after_surname (Optional[str]): The surname of the last contact of the previous page.
+        after_id (Optional[int]): The ID of the last contact of the previous page.
 
     Returns:
         List[ContactResponse]: A list of contacts matching the search criteria.
+
+    Raises:
+        HTTPException: If only one of ``after_surname`` and ``after_id`` is given.
     """
-    return await contact_service.get_contacts(skip, limit, user, name, surname, email)
+    if (after_surname is None) != (after_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="after_surname and after_id must be given together",
+        )
+    after = (after_surname, after_id) if after_id is not None else None
+    payload = await contact_service.get_contacts_json(
+        skip, limit, user, name, surname, email, q, after
+    )
+    return etag_response(request, payload)
 
 
 @router.post("/", response_model=ContactResponse, status_code=status.HTTP_201_CREATED)
@@ -103,32 +154,35 @@ async def create_contact(
     return contact
 
 
-router.get("/birthdays-next-week", response_model=List[ContactResponse])
-
-
 @router.get("/birthdays/upcoming", response_model=List[ContactResponse])
 async def get_upcoming_birthdays(
-    days: int = Query(7), db: AsyncSession = Depends(get_db),
+    request: Request,
+    days: int = Query(7, ge=0, le=365),
+    contact_service: ContactService = Depends(get_contact_service),
     user: User = Depends(get_current_user)
 ):
     """
     Retrieves a list of contacts with birthdays in the upcoming specified number of days.
 
+    The serialized response is cached per user and ``days`` for a short time
+    and dropped whenever one of the user's contacts changes.
+
     Args:
-        days (int): The number of days ahead to check for upcoming birthdays. Defaults to 7.
-        db (AsyncSession): The database session provided by dependency injection.
+        request (Request): The incoming request, checked for ``If-None-Match``.
+        days (int): The number of days ahead to check for upcoming birthdays, from 0 to 365. Defaults to 7.
+        contact_service (ContactService): The contact service instance.
         user (User): The user whose contacts' birthdays are being retrieved.
 
     Returns:
         List[ContactResponse]: A list of contacts with upcoming birthdays.
     """
-    contact_service = ContactService(db)
-    contacts = await contact_service.get_upcoming_birthdays(user, days)
-    return contacts
+    payload = await contact_service.get_upcoming_birthdays_json(user, days)
+    return etag_response(request, payload)
 
 
 @router.get("/{contact_id}", response_model=ContactResponse)
 async def read_contact(
+    request: Request,
     contact_id: int,
     user: User = Depends(get_current_user),
     contact_service: ContactService = Depends(get_contact_service),
@@ -137,6 +191,7 @@ async def read_contact(
     Retrieves a single contact by ID for the user.
 
     Args:
+        request (Request): The incoming request, checked for ``If-None-Match``.
         contact_id (int): The ID of the contact to retrieve.
         user (User): The user whose contact to retrieve.
         contact_service (ContactService): The contact service instance.
@@ -147,8 +202,8 @@ async def read_contact(
     Returns:
         ContactResponse: The contact with the given ID.
     """
-    contact = await contact_service.get_contact(contact_id, user)
-    return ensure_contact_exists(contact)
+    payload = await contact_service.get_contact_json(contact_id, user)
+    return etag_response(request, payload)
 
 
 @router.put("/{contact_id}", response_model=ContactResponse)
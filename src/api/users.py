@@ -1,74 +1,108 @@
-from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile, status
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+from functools import lru_cache
+
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 
-from src.database.db import get_db
 from src.schemas import User
 from src.conf.config import settings
 from src.services.auth import get_current_user, get_current_admin_user
-from src.services.users import UserService
 from src.services.upload_file import UploadFileService
+from src.services.avatar_queue import AvatarUploadQueue
+from src.services.rate_limit import RateLimiter
 import logging
 
 router = APIRouter(prefix="/users", tags=["users"])
-limiter = Limiter(key_func=get_remote_address)
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+me_rate_limiter = RateLimiter(times=10, seconds=60)
 logger = logging.getLogger(__name__)
 
-upload_service = UploadFileService(
-    settings.CLD_NAME, settings.CLD_API_KEY, settings.CLD_API_SECRET
-)
 
+@lru_cache(maxsize=1)
+def get_upload_service() -> UploadFileService:
+    """
+    Provides the shared UploadFileService instance, created on first use.
+
+    Returns:
+        UploadFileService: The Cloudinary upload service.
+    """
+    return UploadFileService(
+        settings.CLD_NAME, settings.CLD_API_KEY, settings.CLD_API_SECRET
+    )
+
+
+@lru_cache(maxsize=1)
+def get_avatar_queue() -> AvatarUploadQueue:
+    """
+    Provides the shared background avatar upload queue, created on first use.
+
+    Returns:
+        AvatarUploadQueue: The avatar upload queue.
+    """
+    return AvatarUploadQueue(
+        get_upload_service(),
+        workers=settings.AVATAR_UPLOAD_WORKERS,
+        maxsize=settings.AVATAR_QUEUE_SIZE,
+    )
 
-@router.get("/me", response_model=User, description="No more than 10 requests per minute")
-@limiter.limit("10/minute")
-async def me(request: Request, user: User = Depends(get_current_user)):
+
+@router.get(
+    "/me",
+    response_model=User,
+    description="No more than 10 requests per minute",
+    dependencies=[Depends(me_rate_limiter)],
+)
+async def me(user: User = Depends(get_current_user)):
     """
     Retrieves the current user's details.
 
     Args:
-        request (Request): The FastAPI request.
         user (User): The current user.
 
     Returns:
         User: The current user.
     """
-    logger.info(f"User details accessed: {user.username}")
+    logger.info("User details accessed: %s", user.username)
     return user
 
 
-@router.patch("/avatar", response_model=User)
+@router.patch("/avatar", response_model=User, status_code=status.HTTP_202_ACCEPTED)
 async def update_avatar_user(
     file: UploadFile = File(...),
     user: User = Depends(get_current_admin_user),
-    db: AsyncSession = Depends(get_db),
+    avatar_queue: AvatarUploadQueue = Depends(get_avatar_queue),
 ):
     """
-    Updates the avatar of the current user.
+    Schedules an update of the current user's avatar.
+
+    The image is uploaded to Cloudinary by a background worker, which retries
+    failed uploads and stores the new avatar URL once the upload succeeds.
 
     Args:
         file (UploadFile): The new avatar image file.
         user (User): The current user.
-        db (AsyncSession): The database session to use for the update.
+        avatar_queue (AvatarUploadQueue): The queue the upload is scheduled on.
 
     Returns:
-        User: The updated user with the new avatar URL.
+        User: The current user; the avatar URL changes once the upload completes.
 
     Raises:
-        HTTPException: If the avatar update fails.
+        HTTPException: If the avatar upload cannot be scheduled, with status 503
+        when too many uploads are already pending.
     """
     try:
-        avatar_url = upload_service.upload_file(file, user.username)
-        logger.info(f"Avatar uploaded for user: {user.username}, URL: {avatar_url}")
+        content = await file.read()
+        await avatar_queue.enqueue(user.email, user.username, content, file.content_type)
+        logger.info("Avatar upload scheduled for user: %s", user.username)
+        return user
 
-        user_service = UserService(db)
-        updated_user = await user_service.update_avatar_url(user.email, avatar_url)
-        logger.info(f"Avatar updated successfully for user: {user.username}")
-        return updated_user
+    except asyncio.QueueFull:
+        logger.warning("Avatar upload queue is full, rejecting upload for user %s", user.username)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many avatar uploads in progress, please try again later.",
+        )
 
     except Exception as e:
-        logger.error(f"Failed to update avatar for user {user.username}: {e}")
+        logger.error("Failed to schedule avatar upload for user %s: %s", user.username, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while updating the avatar.",
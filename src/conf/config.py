@@ -1,18 +1,32 @@
+from functools import lru_cache
+
 from pydantic import ConfigDict, EmailStr
 from pydantic_settings import BaseSettings
-from dotenv import load_dotenv
-
-load_dotenv()
 
 
 class Settings(BaseSettings):
     DB_URL: str
+    # per-engine echo logs every statement; for ad-hoc debugging prefer raising
+    # the level of the "sqlalchemy.engine" logger
+    ECHO_SQL: bool = False
+    # size the pool so that DB_POOL_SIZE + DB_MAX_OVERFLOW covers the expected
+    # number of concurrent requests per worker
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    USE_PGBOUNCER: bool = False
     REDIS_URL: str = "redis://redis:6379"
     REDIS_TTL: int = 3600
+    PASSWORD_CACHE_TTL: int = 60
+    CONTACTS_CACHE_TTL: int = 300
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_SECONDS: int = 3600
     JWT_REFRESH_EXPIRATION_SECONDS: int = 60 * 24 * 7
+    # bcrypt cost factor: 10 keeps a hash around 100ms on commodity CPUs,
+    # raise it when hardware allows, every extra round doubles the cost
+    BCRYPT_ROUNDS: int = 10
+    # worker threads shared by bcrypt and blocking uploads (anyio defaults to 40)
+    THREADPOOL_SIZE: int = 200
 
     MAIL_USERNAME: EmailStr
     MAIL_PASSWORD: str
@@ -28,6 +42,10 @@ class Settings(BaseSettings):
     CLD_NAME: str
     CLD_API_KEY: str
     CLD_API_SECRET: str
+    AVATAR_UPLOAD_WORKERS: int = 8
+    AVATAR_QUEUE_SIZE: int = 100
+
+    ALLOWED_ORIGINS: list[str] = ["*"]
 
     model_config = ConfigDict(
         extra="ignore",
@@ -37,4 +55,15 @@ class Settings(BaseSettings):
     )
 
 
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Returns the application settings, read from the environment and ``.env`` once.
+
+    Returns:
+        Settings: The cached application settings.
+    """
+    return Settings()
+
+
+settings = get_settings()
\ No newline at end of file
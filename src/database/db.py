@@ -1,22 +1,54 @@
+import asyncio
 import contextlib
+import logging
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool, QueuePool
 from src.conf.config import settings
 
+logger = logging.getLogger(__name__)
+
 
 class DatabaseSessionManager:
     def __init__(self, url: str):
         """
         Initialize the database session manager.
 
+        When ``USE_PGBOUNCER`` is set, connection pooling is left to PgBouncer:
+        the engine opens a connection per checkout and asyncpg's prepared
+        statement caches are disabled, as they do not survive transaction pooling.
+
         Args:
             url (str): The database connection URL
         """
+        if settings.USE_PGBOUNCER:
+            engine_options = {
+                "poolclass": NullPool,
+                "connect_args": {"statement_cache_size": 0, "prepared_statement_cache_size": 0},
+            }
+        else:
+            engine_options = {
+                "pool_size": settings.DB_POOL_SIZE,
+                "max_overflow": settings.DB_MAX_OVERFLOW,
+                "pool_timeout": 30,
+                "pool_pre_ping": True,
+                "pool_recycle": 1800,
+                # reuse the most recently returned connection so a hot subset stays
+                # warm and surplus connections can idle out and be recycled
+                "pool_use_lifo": True,
+                "connect_args": {
+                    # Postgres JIT only pays off for long analytic queries, not short OLTP lookups
+                    "server_settings": {"jit": "off"},
+                    # keep the plans of the repeated contact and user lookups prepared
+                    "statement_cache_size": 256,
+                    "prepared_statement_cache_size": 256,
+                },
+            }
         self._engine: AsyncEngine = create_async_engine(
-            url, pool_size=10, max_overflow=20, echo=True
+            url, echo=settings.ECHO_SQL, query_cache_size=1200, **engine_options
         )
         self._session_maker: async_sessionmaker = async_sessionmaker(
-            autoflush=False, autocommit=False, bind=self._engine
+            autoflush=False, autocommit=False, expire_on_commit=False, bind=self._engine
         )
 
     @contextlib.asynccontextmanager
@@ -39,6 +71,46 @@ class DatabaseSessionManager:
         finally:
             await session.close()
 
+    async def warm_up(self):
+        """
+        Opens the pooled connections up front.
+
+        Checks out ``pool_size`` connections concurrently and returns them to the
+        pool, so the first requests after startup do not pay the connect latency.
+        Warm-up is best effort: failed connections are logged, not raised, so the
+        app still starts and the health check reports an unreachable database.
+        Does nothing when pooling is left to PgBouncer.
+        """
+        if isinstance(self._engine.pool, NullPool):
+            return
+        results = await asyncio.gather(
+            *(self._engine.connect() for _ in range(self._engine.pool.size())),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        connections = [result for result in results if not isinstance(result, BaseException)]
+        await asyncio.gather(
+            *(connection.close() for connection in connections), return_exceptions=True
+        )
+        if errors:
+            logger.warning(
+                "Database pool warm-up opened %d of %d connections: %s",
+                len(connections), len(results), errors[0],
+            )
+
+    def pool_healthy(self) -> bool:
+        """
+        Checks the connection pool state without touching the database.
+
+        Returns:
+            bool: False if every pooled and overflow connection is checked out,
+            True otherwise or when pooling is left to PgBouncer.
+        """
+        pool = self._engine.pool
+        if not isinstance(pool, QueuePool):
+            return True
+        return pool.checkedout() < pool.size() + settings.DB_MAX_OVERFLOW
+
     async def close(self):
         """
         Dispose of the database engine.
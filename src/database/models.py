@@ -2,7 +2,10 @@ import enum
 from datetime import datetime, date
 from typing import Optional
 
-from sqlalchemy import Column, Enum as SqlEnum, Integer, String, Boolean, func
+from sqlalchemy import (
+    Column, Computed, Enum as SqlEnum, Index, Integer, String, Boolean, UniqueConstraint, extract,
+    func, literal_column
+)
 from sqlalchemy.orm import mapped_column, Mapped, DeclarativeBase, relationship
 from sqlalchemy.sql.schema import ForeignKey
 from sqlalchemy.sql.sqltypes import DateTime, Date
@@ -12,6 +15,29 @@ class Base(DeclarativeBase):
     pass
 
 
+def search_document(name, surname, email):
+    """
+    Builds the ``simple`` full-text document over the searchable contact fields.
+
+    The GIN index and the search filter must use the same expression for
+    Postgres to match one to the other.
+
+    Args:
+        name: The contact name column or expression.
+        surname: The contact surname column or expression.
+        email: The contact email column or expression.
+
+    Returns:
+        sqlalchemy.sql.functions.Function: The ``to_tsvector`` expression.
+    """
+    document = func.coalesce(name, literal_column("''"))
+    for column in (surname, email):
+        document = (
+            document.op("||")(literal_column("' '")).op("||")(func.coalesce(column, literal_column("''")))
+        )
+    return func.to_tsvector(literal_column("'simple'"), document)
+
+
 class UserRole(enum.Enum):
     USER = "USER"
     ADMIN = "ADMIN"
@@ -23,12 +49,21 @@ class Contact(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(150), nullable=False)
     surname: Mapped[str] = mapped_column(String(150), nullable=False)
-    email: Mapped[str] = mapped_column(String(150), nullable=False, unique=True, index=True)
+    email: Mapped[str] = mapped_column(String(150), nullable=False)
     phone_number: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
     birthday: Mapped[date] = mapped_column(Date, nullable=False)
+    # Birthday as MMDD (e.g. 1231), kept by the database so upcoming birthdays are a range scan
+    birthday_md: Mapped[int] = mapped_column(
+        Integer,
+        Computed(
+            extract("month", literal_column("birthday")) * 100
+            + extract("day", literal_column("birthday")),
+            persisted=True,
+        ),
+    )
     address_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("address.id", ondelete="CASCADE"))
     address: Mapped[Optional["Address"]] = relationship(
-        "Address", back_populates="contacts", lazy="joined", single_parent=True
+        "Address", back_populates="contacts", lazy="raise", single_parent=True
     )
     user_id = mapped_column(
         "user_id", ForeignKey("users.id", ondelete="CASCADE"), default=None
@@ -37,6 +72,19 @@ class Contact(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=func.now(), onupdate=func.now())
 
+    # Every contact query is scoped to a user, so user_id leads each index;
+    # an email is unique within the contacts of one user
+    __table_args__ = (
+        UniqueConstraint("user_id", "email", name="uq_contact_user_email"),
+        Index("ix_contact_user_surname_id", "user_id", "surname", "id"),
+        Index("ix_contact_user_birthday_md", "user_id", "birthday_md"),
+        Index(
+            "ix_contact_search",
+            search_document(literal_column("name"), literal_column("surname"), literal_column("email")),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
+
     def __repr__(self):
         """Return a string representation of the Contact object.
 
@@ -7,10 +7,12 @@ async def get_redis():
     """
     Returns the Redis client for the app. If the Redis client hasn't been initialized, raises a RuntimeError.
 
+    Kept as a coroutine on purpose: FastAPI calls ``async def`` dependencies
+    on the event loop, while plain ``def`` ones are dispatched to the thread pool.
+
     Returns:
         redis.asyncio.Redis: The Redis client.
     """
-    global redis_client
     if redis_client is None:
         raise RuntimeError("Redis is not initialized.")
     return redis_client
@@ -1,13 +1,28 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime, timedelta
 
-from sqlalchemy import and_, or_, select, extract
+from sqlalchemy import (
+    and_, bindparam, delete, func, insert, literal_column, or_, select, tuple_, update
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from src.database.models import Contact, Address, User
+from src.database.models import Contact, Address, User, search_document
 from src.schemas import ContactUpdate, ContactCreate
 
+# Single-contact lookups are built once; only the bound values change per call
+CONTACT_BY_ID = (
+    select(Contact)
+    .options(raiseload("*"), joinedload(Contact.address))
+    .where(Contact.id == bindparam("contact_id"), Contact.user_id == bindparam("user_id"))
+)
+CONTACT_BY_EMAIL = (
+    select(Contact)
+    .options(raiseload("*"), joinedload(Contact.address))
+    .where(Contact.email == bindparam("email"), Contact.user_id == bindparam("user_id"))
+)
 
 class ContactRepository:
     def __init__(self, session: AsyncSession):
@@ -23,10 +38,34 @@ class ContactRepository:
         """
         Generate a base SQLAlchemy query for selecting contacts.
 
+        ``Contact.address`` is never loaded implicitly; list queries add
+        ``selectinload`` and the prebuilt single-row lookups use ``joinedload``.
+        Every other relationship raises instead of lazy loading one row at a time.
+
         Returns:
             sqlalchemy.Select: A base query for selecting contacts.
         """
-        return select(Contact)
+        return select(Contact).options(raiseload("*"))
+
+    def _search_filter(self, q: str):
+        """
+        Generate a full-text filter over the contact name, surname and email.
+
+        On Postgres the query is matched against the GIN-indexed ``tsvector``
+        document; other databases fall back to substring matching.
+
+        Args:
+            q (str): The text to search for.
+
+        Returns:
+            sqlalchemy.ColumnElement: The search filter.
+        """
+        if self.db.bind.dialect.name == "postgresql":
+            document = search_document(Contact.name, Contact.surname, Contact.email)
+            return document.op("@@")(func.plainto_tsquery(literal_column("'simple'"), q))
+        return or_(
+            *(column.ilike(f"%{q}%") for column in (Contact.name, Contact.surname, Contact.email))
+        )
 
     async def get_contacts(
         self,
@@ -36,10 +75,17 @@ class ContactRepository:
         name: Optional[str] = None,
         surname: Optional[str] = None,
         email: Optional[str] = None,
+        q: Optional[str] = None,
+        after: Optional[Tuple[str, int]] = None,
     ) -> List[Contact]:
         """
         Retrieves a list of contacts for the user with optional search query and pagination.
 
+        ``name``, ``surname`` and ``email`` match substrings; ``q`` runs an
+        indexed full-text search over all three. Contacts are ordered by surname
+        and ID, so passing the last ``(surname, id)`` of a page as ``after`` seeks
+        straight to the next page through the index instead of skipping rows.
+
         Args:
             skip (int): The number of contacts to skip.
             limit (int): The maximum number of contacts to return.
@@ -47,6 +93,8 @@ class ContactRepository:
             name (Optional[str]): The name to search for.
             surname (Optional[str]): The surname to search for.
             email (Optional[str]): The email to search for.
+            q (Optional[str]): The words to search for in name, surname and email.
+            after (Optional[Tuple[str, int]]): The surname and ID of the last contact of the previous page.
 
         Returns:
             List[Contact]: A list of contacts matching the search criteria.
@@ -58,16 +106,24 @@ class ContactRepository:
             filters.append(Contact.surname.ilike(f"%{surname}%"))
         if email:
             filters.append(Contact.email.ilike(f"%{email}%"))
+        if q:
+            filters.append(self._search_filter(q))
+        if after is not None:
+            filters.append(tuple_(Contact.surname, Contact.id) > tuple_(*after))
 
         stmt = (
             self._base_query()
             .options(selectinload(Contact.address))
             .filter(and_(*filters))
+            .order_by(Contact.surname, Contact.id)
             .offset(skip)
             .limit(limit)
+            .execution_options(yield_per=100)
         )
-        result = await self.db.execute(stmt)
-        return result.scalars().all()
+        # Stream rows from a server-side cursor in bounded batches instead of
+        # buffering the whole result before building ORM objects
+        result = await self.db.stream_scalars(stmt)
+        return [contact async for contact in result]
 
     async def get_contact_by_id(self, contact_id: int, user: User) -> Optional[Contact]:
         """
@@ -80,12 +136,9 @@ class ContactRepository:
         Returns:
             Optional[Contact]: The contact with the given ID if exists, otherwise None.
         """
-        stmt = (
-            self._base_query()
-            .options(selectinload(Contact.address))
-            .filter(and_(Contact.id == contact_id, Contact.user == user))
+        result = await self.db.execute(
+            CONTACT_BY_ID, {"contact_id": contact_id, "user_id": user.id}
         )
-        result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
     async def get_contact_by_email(
@@ -103,45 +156,60 @@ class ContactRepository:
         Returns:
             Optional[Contact]: The contact with the given email if exists, otherwise None.
         """
-        stmt = (
-            self._base_query()
-            .options(selectinload(Contact.address))
-            .filter(and_(Contact.email == email, Contact.user == user))
-        )
-        result = await self.db.execute(stmt)
+        result = await self.db.execute(CONTACT_BY_EMAIL, {"email": email, "user_id": user.id})
         return result.scalar_one_or_none()
 
     async def create_contact(self, body: ContactCreate, user: User) -> Contact:
         """
         Create a new contact for the user.
 
+        The address and the contact are written with ``INSERT .. RETURNING``, so
+        the new rows, server defaults included, come back without a re-select.
+
         Args:
             body (ContactCreate): The contact creation data.
             user (User): The user creating the contact.
 
         Returns:
             Contact: The newly created contact.
+
+        Raises:
+            IntegrityError: If the user already has a contact with this email.
         """
-        address_data = body.address
         address = None
-        if address_data:
-            address = Address(**address_data.model_dump(exclude_unset=True))
-            self.db.add(address)
-
-        contact = Contact(
-            **body.model_dump(exclude={"address"}, exclude_unset=True),
-            address=address,
-            user_id=user.id,
-        )
-        self.db.add(contact)
+        if body.address:
+            result = await self.db.execute(
+                insert(Address)
+                .values(**body.address.model_dump(exclude_unset=True))
+                .returning(Address)
+            )
+            address = result.scalar_one()
+
+        try:
+            result = await self.db.execute(
+                insert(Contact)
+                .values(
+                    **body.model_dump(exclude={"address"}, exclude_unset=True),
+                    address_id=address.id if address else None,
+                    user_id=user.id,
+                )
+                .returning(Contact)
+            )
+        except IntegrityError:
+            await self.db.rollback()
+            raise
+        contact = result.scalar_one()
+        set_committed_value(contact, "address", address)
         await self.db.commit()
-        await self.db.refresh(contact)
         return contact
 
     async def remove_contact(self, contact_id: int, user: User) -> Optional[Contact]:
         """
         Remove a contact by ID for the user.
 
+        The contact is removed with a single ``DELETE .. RETURNING``; its address,
+        if any, is removed by id with one more statement.
+
         Args:
             contact_id (int): The ID of the contact to remove.
             user (User): The user whose contact to remove.
@@ -149,11 +217,20 @@ class ContactRepository:
         Returns:
             Optional[Contact]: The removed contact if it existed, otherwise None.
         """
-        contact = await self.get_contact_by_id(contact_id, user)
+        result = await self.db.execute(
+            delete(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .returning(Contact)
+            .execution_options(synchronize_session=False)
+        )
+        contact = result.scalar_one_or_none()
         if contact:
-            if contact.address:
-                await self.db.delete(contact.address)
-            await self.db.delete(contact)
+            if contact.address_id:
+                await self.db.execute(
+                    delete(Address)
+                    .where(Address.id == contact.address_id)
+                    .execution_options(synchronize_session=False)
+                )
             await self.db.commit()
         return contact
 
@@ -163,6 +240,10 @@ class ContactRepository:
         """
         Update a contact by ID for the user.
 
+        The contact is written with a single ``UPDATE .. RETURNING``. An address
+        change updates the linked address the same way, or inserts a new one
+        and links it to the contact.
+
         Args:
             contact_id (int): The ID of the contact to update.
             body (ContactUpdate): The contact update data.
@@ -171,30 +252,56 @@ class ContactRepository:
         Returns:
             Optional[Contact]: The updated contact if it existed, otherwise None.
         """
-        contact = await self.get_contact_by_id(contact_id, user)
+        result = await self.db.execute(
+            update(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .values(**body.model_dump(exclude_unset=True, exclude={"address"}))
+            .returning(Contact)
+            .execution_options(synchronize_session=False)
+        )
+        contact = result.scalar_one_or_none()
         if not contact:
             return None
 
-        for key, value in body.model_dump(exclude_unset=True, exclude={"address"}).items():
-            setattr(contact, key, value)
-
+        address = None
         if body.address:
-            if contact.address:
-                for key, value in body.address.model_dump(exclude_unset=True).items():
-                    setattr(contact.address, key, value)
+            address_changes = body.address.model_dump(exclude_unset=True)
+            if contact.address_id:
+                result = await self.db.execute(
+                    update(Address)
+                    .where(Address.id == contact.address_id)
+                    .values(**address_changes)
+                    .returning(Address)
+                    .execution_options(synchronize_session=False)
+                )
+                address = result.scalar_one()
             else:
-                new_address = Address(**body.address.model_dump(exclude_unset=True))
-                contact.address = new_address
-                self.db.add(new_address)
-
+                result = await self.db.execute(
+                    insert(Address).values(**address_changes).returning(Address)
+                )
+                address = result.scalar_one()
+                await self.db.execute(
+                    update(Contact)
+                    .where(Contact.id == contact.id)
+                    .values(address_id=address.id)
+                    .execution_options(synchronize_session=False)
+                )
+                set_committed_value(contact, "address_id", address.id)
+        elif contact.address_id:
+            address = await self.db.get(Address, contact.address_id)
+
+        set_committed_value(contact, "address", address)
         await self.db.commit()
-        await self.db.refresh(contact)
         return contact
 
     async def get_upcoming_birthdays(self, user: User, days: int = 7) -> List[Contact]:
         """
         Retrieve a list of contacts whose birthdays are in the upcoming specified number of days for a given user.
 
+        Birthdays are compared as MMDD numbers; when the range crosses the end of
+        the year it is split into the tail of this year and the head of the next.
+        A range of a year or more covers every birthday, so no filter is applied.
+
         Args:
             user (User): The user whose contacts are to be checked for upcoming birthdays.
             days (int): The number of days ahead to check for upcoming birthdays. Defaults to 7.
@@ -202,16 +309,24 @@ class ContactRepository:
         Returns:
             List[Contact]: A list of contacts with upcoming birthdays within the specified range.
         """
-        today = datetime.now().date()
-        upcoming_date = today + timedelta(days=days)
-
-        stmt = select(Contact).filter(
-            or_(
-                (extract("month", Contact.birthday) == today.month) & (extract("day", Contact.birthday) >= today.day),
-                (extract("month", Contact.birthday) == upcoming_date.month)
-                & (extract("day", Contact.birthday) <= upcoming_date.day),
-            ),
-            Contact.user == user,
+        stmt = (
+            self._base_query()
+            .options(selectinload(Contact.address))
+            .filter(Contact.user == user)
         )
+
+        if days < 365:
+            today = datetime.now().date()
+            upcoming_date = today + timedelta(days=days)
+
+            start = today.month * 100 + today.day
+            end = upcoming_date.month * 100 + upcoming_date.day
+            if end >= start:
+                stmt = stmt.filter(Contact.birthday_md.between(start, end))
+            else:
+                stmt = stmt.filter(
+                    or_(Contact.birthday_md >= start, Contact.birthday_md <= end)
+                )
+
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
\ No newline at end of file
@@ -1,10 +1,24 @@
-from typing import Optional
-from sqlalchemy import select
+from typing import List, Optional
+from sqlalchemy import bindparam, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User
 from src.schemas import UserCreate
 
+# Lookups with a fixed shape are built once; only the bound values change per call
+USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+USER_BY_USERNAME_AND_REFRESH_TOKEN = USER_BY_USERNAME.where(
+    User.refresh_token == bindparam("refresh_token")
+)
+USER_AUTH_BY_USERNAME = select(
+    User.id, User.username, User.email, User.avatar, User.role
+).where(User.username == bindparam("username"))
+USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+USERS_BY_EMAIL_OR_USERNAME = select(User).where(
+    or_(User.email == bindparam("email"), User.username == bindparam("username"))
+)
 
 class UserRepository:
     def __init__(self, session: AsyncSession):
@@ -26,8 +40,7 @@ class UserRepository:
         Returns:
             User | None: The user object if found, otherwise None.
         """
-        stmt = select(User).filter_by(id=user_id)
-        user = await self.db.execute(stmt)
+        user = await self.db.execute(USER_BY_ID, {"user_id": user_id})
         return user.scalar_one_or_none()
 
     async def get_user_by_username(self, username: str, refresh_token: str | None) -> User | None:
@@ -41,13 +54,32 @@ class UserRepository:
         Returns:
             User | None: The user object if found, otherwise None.
         """
-        stmt = select(User).filter_by(username=username)
-
         if refresh_token:
-            stmt = stmt.filter_by(refresh_token=refresh_token)
-        user = await self.db.execute(stmt)
+            user = await self.db.execute(
+                USER_BY_USERNAME_AND_REFRESH_TOKEN,
+                {"username": username, "refresh_token": refresh_token},
+            )
+        else:
+            user = await self.db.execute(USER_BY_USERNAME, {"username": username})
         return user.scalar_one_or_none()
 
+    async def get_user_auth_projection(self, username: str) -> User | None:
+        """
+        Retrieve only the user columns needed to authenticate a request.
+
+        The password hash, refresh token and timestamps are not fetched; the
+        returned user is not attached to the session.
+
+        Args:
+            username (str): The username of the user to retrieve.
+
+        Returns:
+            User | None: A detached user with id, username, email, avatar and role if found, otherwise None.
+        """
+        result = await self.db.execute(USER_AUTH_BY_USERNAME, {"username": username})
+        row = result.one_or_none()
+        return User(**row._mapping) if row else None
+
     async def get_user_by_email(self, email: str) -> User | None:
         """
         Retrieve a user by their email address.
@@ -58,10 +90,25 @@ class UserRepository:
         Returns:
             User | None: The user object if found, otherwise None.
         """
-        stmt = select(User).filter_by(email=email)
-        user = await self.db.execute(stmt)
+        user = await self.db.execute(USER_BY_EMAIL, {"email": email})
         return user.scalar_one_or_none()
 
+    async def get_users_by_email_or_username(self, email: str, username: str) -> List[User]:
+        """
+        Retrieve users matching either the given email address or username in one query.
+
+        Args:
+            email (str): The email address to match.
+            username (str): The username to match.
+
+        Returns:
+            List[User]: Up to two users matching the email or the username.
+        """
+        users = await self.db.execute(
+            USERS_BY_EMAIL_OR_USERNAME, {"email": email, "username": username}
+        )
+        return list(users.scalars().all())
+
     async def create_user(self, body: UserCreate, avatar: Optional[str] = None) -> User:
         """
         Creates a new user with the given data and a default avatar URL using Gravatar.
@@ -72,6 +119,9 @@ class UserRepository:
 
         Returns:
             User: The newly created user object.
+
+        Raises:
+            IntegrityError: If the email or the username is already taken.
         """
         user = User(
             **body.model_dump(exclude_unset=True, exclude={"password"}),
@@ -79,7 +129,11 @@ class UserRepository:
             avatar=avatar
         )
         self.db.add(user)
-        await self.db.commit()
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            raise
         await self.db.refresh(user)
         return user
 
@@ -100,7 +154,7 @@ class UserRepository:
 
     async def confirmed_email(self, email: str) -> None:
         """
-        Marks a user's email as confirmed.
+        Marks a user's email as confirmed with a single UPDATE statement.
 
         Args:
             email (str): The email address of the user to confirm.
@@ -108,13 +162,39 @@ class UserRepository:
         Returns:
             None
         """
-        user = await self.get_user_by_email(email)
-        user.confirmed = True
+        await self.db.execute(
+            update(User)
+            .where(User.email == email)
+            .values(confirmed=True)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+
+    async def update_password_by_email(self, email: str, hashed_password: str) -> None:
+        """
+        Replaces a user's password hash with a single UPDATE .. RETURNING statement.
+
+        Args:
+            email (str): The email address of the user to update.
+            hashed_password (str): The new hashed password.
+
+        Raises:
+            ValueError: If the user is not found.
+        """
+        result = await self.db.execute(
+            update(User)
+            .where(User.email == email)
+            .values(hashed_password=hashed_password)
+            .returning(User.id)
+            .execution_options(synchronize_session=False)
+        )
+        if result.first() is None:
+            raise ValueError("User not found")
         await self.db.commit()
 
     async def update_avatar_url(self, email: str, url: str) -> User:
         """
-        Updates a user's avatar URL.
+        Updates a user's avatar URL with a single UPDATE .. RETURNING statement.
 
         Args:
             email (str): The email address of the user to update.
@@ -123,11 +203,15 @@ class UserRepository:
         Returns:
             User: The updated user object if found, otherwise raises a ValueError.
         """
-        user = await self.get_user_by_email(email)
-        if user:
-            user.avatar = url
-            await self.db.commit()
-            await self.db.refresh(user)
-            return user
-        else:
+        result = await self.db.execute(
+            update(User)
+            .where(User.email == email)
+            .values(avatar=url)
+            .returning(User)
+            .execution_options(populate_existing=True)
+        )
+        user = result.scalar_one_or_none()
+        if not user:
             raise ValueError("User not found")
+        await self.db.commit()
+        return user
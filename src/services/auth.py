@@ -1,14 +1,18 @@
 import logging
-import json
+import hashlib
+import hmac
+import time
 
-from datetime import datetime, timedelta, UTC
+from collections import OrderedDict
 from typing import Literal,Optional
 
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from passlib.context import CryptContext
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
+import orjson
 
 from src.redis import get_redis
 from src.database.db import get_db
@@ -17,30 +21,164 @@ from src.services.users import UserService
 from src.database.models import User, UserRole
 
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# The signing key and algorithm are parsed once instead of on every encode and decode
+JWT_ALGORITHM = settings.JWT_ALGORITHM
+JWT_ALGORITHMS = [JWT_ALGORITHM]
+JWT_KEY = jwk.construct(settings.JWT_SECRET, JWT_ALGORITHM)
+PASSWORD_CACHE_KEY = settings.JWT_SECRET.encode()
+
 class Hash:
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    # min/max pin the cost factor, so hashes made with other rounds need an update
+    pwd_context = CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=settings.BCRYPT_ROUNDS,
+        bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+        bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+    )
 
-    def verify_password(self, plain_password, hashed_password):
+    async def verify_password(self, plain_password, hashed_password):
         """
         Verifies that the plain password matches the hashed password.
+
+        bcrypt runs in the worker thread pool, so the event loop keeps serving
+        other requests meanwhile.
         """
-        return self.pwd_context.verify(plain_password, hashed_password)
+        return await run_in_threadpool(self.pwd_context.verify, plain_password, hashed_password)
 
-    def get_password_hash(self, password: str) -> str:
+    async def get_password_hash(self, password: str) -> str:
         """
         Returns the hashed version of the given password.
+
+        bcrypt runs in the worker thread pool, so the event loop keeps serving
+        other requests meanwhile.
         """
-        return self.pwd_context.hash(password)
+        return await run_in_threadpool(self.pwd_context.hash, password)
+
+    def needs_update(self, hashed_password: str) -> bool:
+        """
+        Returns True if the hash was made with another scheme or cost factor.
+        """
+        return self.pwd_context.needs_update(hashed_password)
+
+
+hasher = Hash()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# Cached under its own key for a user whose token names no existing account
+USER_CACHE_MISS = b"__MISS__"
+USER_CACHE_MISS_TTL = 30
+
+# In-process LRU of recently verified access token payloads
+TOKEN_CACHE_MAXSIZE = 10_000
+TOKEN_CACHE_TTL = 60
+_decoded_tokens: "OrderedDict[bytes, tuple[float, dict]]" = OrderedDict()
+
+# In-process LRU of verified password digests, checked before Redis
+VERIFIED_PASSWORDS_MAXSIZE = 1024
+_verified_passwords: "OrderedDict[str, str]" = OrderedDict()
+
+
+def _remember_verified_password(digest: str, hashed_password: str) -> None:
+    """
+    Stores a verified password digest in the in-process LRU.
+
+    Args:
+        digest (str): The HMAC digest of the username and the plain password.
+        hashed_password (str): The password hash the digest was verified against.
+    """
+    _verified_passwords[digest] = hashed_password
+    _verified_passwords.move_to_end(digest)
+    if len(_verified_passwords) > VERIFIED_PASSWORDS_MAXSIZE:
+        _verified_passwords.popitem(last=False)
+
+
+def decode_token_cached(token: str) -> dict:
+    """
+    Decodes a JWT, reusing the payload of a recently verified token.
+
+    Payloads are kept for ``TOKEN_CACHE_TTL`` seconds at most and never past
+    the token expiry. Invalid tokens are not cached.
+
+    Args:
+        token (str): The encoded JWT.
+
+    Raises:
+        JWTError: If the token signature or claims are invalid.
+
+    Returns:
+        dict: The token payload.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+    cached = _decoded_tokens.get(key)
+    if cached is not None and cached[0] > now:
+        _decoded_tokens.move_to_end(key)
+        return cached[1]
+
+    payload = jwt.decode(token, JWT_KEY, algorithms=JWT_ALGORITHMS)
+    expires_at = min(payload.get("exp", now + TOKEN_CACHE_TTL), now + TOKEN_CACHE_TTL)
+    _decoded_tokens[key] = (expires_at, payload)
+    _decoded_tokens.move_to_end(key)
+    if len(_decoded_tokens) > TOKEN_CACHE_MAXSIZE:
+        _decoded_tokens.popitem(last=False)
+    return payload
+
+
+async def verify_password_cached(
+    redis_client, username: str, plain_password: str, hashed_password: str
+) -> bool:
+    """
+    Verifies a password, remembering successful checks in Redis for a short time.
+
+    The cache key is an HMAC of the username and the plain password, so the
+    password itself is never stored. Only successful verifications are cached,
+    and a cached entry is valid only while it matches the current password hash,
+    so a password change invalidates it without an explicit purge. Recent
+    checks are answered from an in-process LRU before Redis is asked.
+
+    Args:
+        redis_client (Redis): The Redis client to use for caching.
+        username (str): The username the password belongs to.
+        plain_password (str): The password provided by the user.
+        hashed_password (str): The stored password hash of the user.
+
+    Returns:
+        bool: True if the password matches the hash, otherwise False.
+    """
+    digest = hmac.new(
+        PASSWORD_CACHE_KEY,
+        f"{username}:{plain_password}".encode(),
+        hashlib.sha256,
+    ).hexdigest()
+    cache_key = f"pwcache:{digest}"
+
+    local_hash = _verified_passwords.get(digest)
+    if local_hash is not None and hmac.compare_digest(local_hash, hashed_password):
+        _verified_passwords.move_to_end(digest)
+        return True
+
+    cached_hash = await redis_client.get(cache_key)
+    if cached_hash is not None and hmac.compare_digest(
+        cached_hash, hashed_password.encode()
+    ):
+        _remember_verified_password(digest, hashed_password)
+        return True
+
+    if not await hasher.verify_password(plain_password, hashed_password):
+        return False
+
+    await redis_client.set(cache_key, hashed_password, ex=settings.PASSWORD_CACHE_TTL)
+    _remember_verified_password(digest, hashed_password)
+    return True
+
 
 # define a function to generate a new access token
 async def create_token(
-    data: dict, token_type: Literal["access", "refresh"], expires_delta: timedelta
+    data: dict, token_type: Literal["access", "refresh"], expires_delta: float
 ):
     """
     Create a new access or refresh token.
@@ -48,21 +186,15 @@ async def create_token(
     Args:
         data (dict): The data to be included in the token.
         token_type (str): The type of token to be created.
-        expires_delta (timedelta): The expiration time for the token.
+        expires_delta (float): The lifetime of the token in seconds.
 
     Returns:
         str: The generated token.
     """
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(UTC) + timedelta(seconds=expires_delta)
-    else:
-        expire = datetime.now(UTC) + timedelta(
-            seconds=int(settings.JWT_EXPIRATION_SECONDS)
-        )
-    to_encode.update({"exp": expire, "token_type": token_type})
+    # JWT time claims are plain unix seconds (RFC 7519)
+    expire = int(time.time() + (expires_delta or settings.JWT_EXPIRATION_SECONDS))
     encoded_jwt = jwt.encode(
-        to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM
+        {**data, "exp": expire, "token_type": token_type}, JWT_KEY, algorithm=JWT_ALGORITHM
     )
     return encoded_jwt
 
@@ -127,9 +259,7 @@ async def verify_refresh_token(
     )
 
     try:
-        payload = jwt.decode(
-            refresh_token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = jwt.decode(refresh_token, JWT_KEY, algorithms=JWT_ALGORITHMS)
         username = payload.get("sub")
         token_type = payload.get("token_type")
         if username is None or token_type != "refresh":
@@ -150,10 +280,10 @@ def create_email_token(data: dict):
     Returns:
         str: The generated token.
     """
-    to_encode = data.copy()
-    expire = datetime.now(UTC) + timedelta(days=7)
-    to_encode.update({"iat": datetime.now(UTC), "exp": expire})
-    token = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+    now = int(time.time())
+    token = jwt.encode(
+        {**data, "iat": now, "exp": now + 7 * 24 * 60 * 60}, JWT_KEY, algorithm=JWT_ALGORITHM
+    )
     return token
 
 
@@ -171,9 +301,7 @@ async def get_email_from_token(token: str):
         str: The email extracted from the token.
     """
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = jwt.decode(token, JWT_KEY, algorithms=JWT_ALGORITHMS)
         email = payload["sub"]
         return email
     except JWTError as e:
@@ -209,24 +337,25 @@ async def get_current_user(
     )
 
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = decode_token_cached(token)
         username = payload.get("sub")
         token_type = payload.get("token_type")
         if username is None or token_type != "access":
             logger.error("Token is missing 'sub' claim.")
             raise credentials_exception
-        logger.info(f"Token payload: {payload}")
+        logger.debug("Token payload: %s", payload)
     except JWTError as e:
-        logger.error(f"JWT decode error: {e} | Token: {token}")
+        logger.error("JWT decode error: %s", e)
         raise credentials_exception
 
-    # Check Redis cache
-    cached_user = await redis_client.get(f"user:{username}")
+    # Never keep the user cached beyond the lifetime of the token that uses it
+    ttl = max(min(int(settings.REDIS_TTL or 3600), int(payload["exp"] - time.time())), 1)
+
+    # Check Redis cache, refreshing the TTL of a hit in the same round trip
+    cached_user = await redis_client.getex(f"user:{username}", ex=ttl)
     if cached_user:
-        logger.info(f"User {username} retrieved from cache")
-        user_data = json.loads(cached_user)
+        logger.debug("User %s retrieved from cache", username)
+        user_data = orjson.loads(cached_user)
         return User(
             id=user_data["id"],
             username=user_data["username"],
@@ -235,11 +364,17 @@ async def get_current_user(
             role=UserRole(user_data["role"]) if user_data["role"] else None,
         )
 
+    # A recent miss keeps its own short TTL, so probing never extends it
+    if await redis_client.get(f"user_miss:{username}") == USER_CACHE_MISS:
+        raise credentials_exception
+
     # Fetch user from the database if not in cache
     user_service = UserService(db)
-    user = await user_service.get_user_by_username(username)
+    user = await user_service.get_user_auth_projection(username)
     if user is None:
-        logger.error(f"User not found: {username}")
+        logger.error("User not found: %s", username)
+        # Remember the miss briefly so replayed tokens do not reach the database
+        await redis_client.set(f"user_miss:{username}", USER_CACHE_MISS, ex=USER_CACHE_MISS_TTL)
         raise credentials_exception
 
     # Cache the user in Redis
@@ -251,12 +386,26 @@ async def get_current_user(
         "role": user.role.value if user.role else None,
     }
 
-    await redis_client.set(f"user:{username}", json.dumps(user_data), ex=int(settings.REDIS_TTL or 3600))  # Cache for 1 hour
-    logger.info(f"User {username} cached in Redis")
-    logger.info(f"Authenticated user: {user.username}")
+    await redis_client.set(f"user:{username}", orjson.dumps(user_data), ex=ttl)
+    logger.debug("User %s cached in Redis", username)
 
     return user
 
+
+async def invalidate_cached_user(redis_client, username: str) -> None:
+    """
+    Drops the cached copy of a user so the next request reloads it from the database.
+
+    Args:
+        redis_client (Redis): The Redis client holding the cache.
+        username (str): The username of the cached user.
+
+    Returns:
+        None
+    """
+    await redis_client.delete(f"user:{username}", f"user_miss:{username}")
+
+
 async def get_current_admin_user(current_user: User = Depends(get_current_user)):
     """
     Verifies that the current user is an admin.
@@ -0,0 +1,149 @@
+import asyncio
+import hashlib
+import logging
+from typing import List, Optional
+
+import orjson
+
+from src.database.db import sessionmanager
+from src.redis import get_redis
+from src.services.auth import invalidate_cached_user
+from src.services.upload_file import UploadFileService
+from src.services.users import UserService
+
+logger = logging.getLogger(__name__)
+
+AVATAR_DIGEST_TTL = 86400
+AVATAR_QUEUE_MAXSIZE = 100
+AVATAR_SHUTDOWN_TIMEOUT = 30.0
+
+
+class AvatarUploadQueue:
+    def __init__(
+        self,
+        upload_service: UploadFileService,
+        workers: int = 8,
+        retries: int = 3,
+        maxsize: int = AVATAR_QUEUE_MAXSIZE,
+    ):
+        """
+        Initialize the background avatar upload queue.
+
+        Args:
+            upload_service (UploadFileService): The service used to upload avatars to Cloudinary.
+            workers (int): The number of concurrent upload workers.
+            retries (int): The number of upload attempts before a job is dropped.
+            maxsize (int): The maximum number of pending uploads held in memory.
+        """
+        self.upload_service = upload_service
+        self.workers = workers
+        self.retries = retries
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """
+        Starts the upload workers on the running event loop.
+        """
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self, timeout: float = AVATAR_SHUTDOWN_TIMEOUT) -> None:
+        """
+        Lets the workers finish the queued uploads, then cancels them.
+
+        Args:
+            timeout (float): The number of seconds to wait for the queue to drain.
+        """
+        if self._tasks:
+            try:
+                await asyncio.wait_for(self.queue.join(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        if not self.queue.empty():
+            logger.warning("Dropping %d queued avatar uploads on shutdown", self.queue.qsize())
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def enqueue(
+        self, email: str, username: str, content: bytes, content_type: Optional[str]
+    ) -> None:
+        """
+        Schedules an avatar upload for the given user.
+
+        Args:
+            email (str): The email address of the user whose avatar is uploaded.
+            username (str): The username the uploaded image is stored under.
+            content (bytes): The image content.
+            content_type (Optional[str]): The MIME type of the image.
+
+        Returns:
+            None
+
+        Raises:
+            asyncio.QueueFull: If too many uploads are already pending.
+        """
+        self.queue.put_nowait((email, username, content, content_type))
+
+    async def _worker(self) -> None:
+        """
+        Processes queued uploads until cancelled.
+        """
+        while True:
+            email, username, content, content_type = await self.queue.get()
+            try:
+                await self._process(email, username, content, content_type)
+            except Exception as e:
+                logger.error("Failed to update avatar for user %s: %s", username, e)
+            finally:
+                self.queue.task_done()
+
+    async def _process(
+        self, email: str, username: str, content: bytes, content_type: Optional[str]
+    ) -> None:
+        """
+        Uploads an avatar with exponential backoff and stores the resulting URL.
+
+        The SHA-256 digest of the last uploaded image is kept in Redis per user, so
+        uploading the same image again reuses its URL instead of re-uploading it.
+
+        Args:
+            email (str): The email address of the user whose avatar is uploaded.
+            username (str): The username the uploaded image is stored under.
+            content (bytes): The image content.
+            content_type (Optional[str]): The MIME type of the image.
+
+        Returns:
+            None
+        """
+        redis_client = await get_redis()
+        digest_key = f"avatar:{username}"
+        digest = hashlib.sha256(content).hexdigest()
+        cached = await redis_client.get(digest_key)
+        last_upload = orjson.loads(cached) if cached is not None else {}
+
+        if last_upload.get("sha256") == digest:
+            avatar_url = last_upload["url"]
+            logger.debug("Avatar unchanged for user %s, skipping upload", username)
+        else:
+            for attempt in range(self.retries):
+                try:
+                    avatar_url = await self.upload_service.upload_file_async(
+                        content, username, content_type
+                    )
+                    break
+                except RuntimeError:
+                    if attempt == self.retries - 1:
+                        raise
+                    await asyncio.sleep(2**attempt)
+            await redis_client.set(
+                digest_key,
+                orjson.dumps({"sha256": digest, "url": avatar_url}),
+                ex=AVATAR_DIGEST_TTL,
+            )
+
+        async with sessionmanager.session() as db:
+            await UserService(db).update_avatar_url(email, avatar_url)
+        await invalidate_cached_user(redis_client, username)
+        logger.info("Avatar updated successfully for user: %s", username)
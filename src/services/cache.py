@@ -0,0 +1,78 @@
+from typing import Awaitable, Callable, Optional
+
+import redis.asyncio as redis
+
+
+class CacheService:
+    def __init__(self, redis_client: redis.Redis):
+        """
+        Initialize the cache service.
+
+        Args:
+            redis_client (redis.asyncio.Redis): The Redis client used as a cache store.
+        """
+        self.redis_client = redis_client
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Retrieves a cached value by key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[bytes]: The cached value, or None if the key is missing.
+        """
+        return await self.redis_client.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        """
+        Stores a value in the cache with an expiration time.
+
+        Args:
+            key (str): The cache key.
+            value (bytes): The value to store.
+            ttl (int): The time to live in seconds.
+
+        Returns:
+            None
+        """
+        await self.redis_client.set(key, value, ex=ttl)
+
+    async def get_or_set(
+        self, key: str, ttl: int, loader: Callable[[], Awaitable[bytes]]
+    ) -> bytes:
+        """
+        Returns the cached value, loading and storing it on a miss.
+
+        Args:
+            key (str): The cache key.
+            ttl (int): The time to live in seconds of a newly stored value.
+            loader (Callable[[], Awaitable[bytes]]): Produces the value on a miss.
+
+        Returns:
+            bytes: The cached or freshly loaded value.
+        """
+        cached = await self.get(key)
+        if cached is not None:
+            return cached
+        value = await loader()
+        await self.set(key, value, ttl)
+        return value
+
+    async def invalidate(self, pattern: str) -> None:
+        """
+        Removes all cached values whose keys match the given glob-style pattern.
+
+        The keys are found with non-blocking SCAN and removed with a single UNLINK,
+        which frees the values in the background instead of blocking Redis.
+
+        Args:
+            pattern (str): The key pattern to match, e.g. ``contacts:1:*``.
+
+        Returns:
+            None
+        """
+        keys = [key async for key in self.redis_client.scan_iter(match=pattern, count=500)]
+        if keys:
+            await self.redis_client.unlink(*keys)
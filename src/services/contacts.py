@@ -1,51 +1,117 @@
-from typing import Optional, List
+from datetime import datetime, timedelta
+from typing import Optional, List, Tuple
+import hashlib
 import logging
 
+import orjson
+from pydantic import TypeAdapter
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
+from src.conf.config import settings
 from src.repository.contacts import ContactRepository
-from src.schemas import ContactCreate, ContactUpdate, User
+from src.schemas import ContactCreate, ContactResponse, ContactUpdate, User
+from src.services.cache import CacheService
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+contact_adapter = TypeAdapter(ContactResponse)
+contacts_adapter = TypeAdapter(List[ContactResponse])
+
+
+def dump_contact(contact) -> bytes:
+    """
+    Serializes a single ORM contact straight to JSON bytes.
+
+    Args:
+        contact (Contact): The contact to serialize.
+
+    Returns:
+        bytes: The JSON-encoded contact.
+    """
+    return contact_adapter.dump_json(
+        contact_adapter.validate_python(contact, from_attributes=True)
+    )
+
+
+def dump_contacts(contacts: List) -> bytes:
+    """
+    Serializes ORM contacts straight to JSON bytes.
+
+    Validation and encoding both run in pydantic-core, which skips FastAPI's
+    per-field jsonable_encoder pass over every row.
+
+    Args:
+        contacts (List[Contact]): The contacts to serialize.
+
+    Returns:
+        bytes: The JSON-encoded list of contacts.
+    """
+    return contacts_adapter.dump_json(
+        contacts_adapter.validate_python(contacts, from_attributes=True)
+    )
+
+
+def seconds_until_midnight(now: datetime) -> int:
+    """
+    Returns the number of seconds left until the next local midnight.
+
+    Args:
+        now (datetime): The current local time.
+
+    Returns:
+        int: The number of seconds until midnight, at least 1.
+    """
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return max(1, int((midnight - now).total_seconds()))
+
 
 class ContactService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, cache: CacheService):
         """
         Initialize the contact service.
 
         Args:
             db (AsyncSession): The database session.
+            cache (CacheService): The cache used for read-heavy contact queries.
         """
         self.contact_repository = ContactRepository(db)
+        self.cache = cache
 
-    async def _ensure_exists(self, check_func, error_message: str, status_code: int):
+    async def _invalidate_cache(self, user: User):
         """
-        Ensure that the given check_func returns a truthy value.
+        Drops every cached contact response of the user.
 
         Args:
-            check_func (Callable): A function that takes no arguments and returns a value.
-            error_message (str): The error message to log and return if the check_func returns a falsy value.
-            status_code (int): The HTTP status code to use for the HTTPException.
+            user (User): The user whose cached responses to drop.
+        """
+        await self.cache.invalidate(f"contacts:{user.id}:*")
 
-        Returns:
-            The result of the check_func.
+    @staticmethod
+    def _contact_not_found(contact_id: int) -> HTTPException:
+        """
+        Logs and builds the error raised for a missing contact.
 
-        Raises:
-            HTTPException: If the check_func returns a falsy value.
+        Args:
+            contact_id (int): The ID of the contact that was not found.
+
+        Returns:
+            HTTPException: The 404 error to raise.
         """
-        obj = await check_func()
-        if not obj:
-            logger.error(error_message)
-            raise HTTPException(status_code=status_code, detail=error_message)
-        return obj
+        logger.error("Contact with ID %s not found", contact_id)
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Contact with ID {contact_id} not found",
+        )
 
     async def create_contact(self, body: ContactCreate, user: User):
         """
         Create a new contact for the user if it doesn't already exist.
 
+        Duplicates are rejected by the unique (user_id, email) constraint rather
+        than by a lookup before the insert.
+
         Args:
             body (ContactCreate): The contact creation data.
             user (User): The user creating the contact.
@@ -56,16 +122,16 @@ class ContactService:
         Returns:
             Contact: The newly created contact.
         """
-        existing_contact = await self.contact_repository.get_contact_by_email(body.email, user)
-        if existing_contact:
-            logger.warning(f"Duplicate contact creation attempt: {body.email}")
+        try:
+            new_contact = await self.contact_repository.create_contact(body, user)
+        except IntegrityError:
+            logger.warning("Duplicate contact creation attempt: %s", body.email)
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Contact with this email already exists",
             )
-
-        new_contact = await self.contact_repository.create_contact(body, user)
-        logger.info(f"Contact created: {new_contact}")
+        await self._invalidate_cache(user)
+        logger.info("Contact created: %s", new_contact)
         return new_contact
 
     async def get_contacts(
@@ -76,6 +142,8 @@ class ContactService:
         name: Optional[str] = None,
         surname: Optional[str] = None,
         email: Optional[str] = None,
+        q: Optional[str] = None,
+        after: Optional[Tuple[str, int]] = None,
     ) -> List:
         """
         Retrieves a list of contacts for the user with optional search query and pagination.
@@ -87,16 +155,55 @@ class ContactService:
             name (Optional[str]): The name to search for.
             surname (Optional[str]): The surname to search for.
             email (Optional[str]): The email to search for.
+            q (Optional[str]): The words to search for in name, surname and email.
+            after (Optional[Tuple[str, int]]): The surname and ID of the last contact of the previous page.
 
         Returns:
             List: A list of contacts matching the search criteria.
         """
         contacts = await self.contact_repository.get_contacts(
-            skip, limit, user, name, surname, email
+            skip, limit, user, name, surname, email, q, after
         )
-        logger.info(f"Retrieved {len(contacts)} contacts for user: {user}")
+        logger.info("Retrieved %d contacts for user: %s", len(contacts), user)
         return contacts
 
+    async def get_contacts_json(
+        self,
+        skip: int,
+        limit: int,
+        user: User,
+        name: Optional[str] = None,
+        surname: Optional[str] = None,
+        email: Optional[str] = None,
+        q: Optional[str] = None,
+        after: Optional[Tuple[str, int]] = None,
+    ) -> bytes:
+        """
+        Retrieves a page of contacts as a serialized JSON response, served from the cache when possible.
+
+        Args:
+            skip (int): The number of contacts to skip.
+            limit (int): The maximum number of contacts to return.
+            user (User): The user whose contacts to retrieve.
+            name (Optional[str]): The name to search for.
+            surname (Optional[str]): The surname to search for.
+            email (Optional[str]): The email to search for.
+            q (Optional[str]): The words to search for in name, surname and email.
+            after (Optional[Tuple[str, int]]): The surname and ID of the last contact of the previous page.
+
+        Returns:
+            bytes: The JSON-encoded list of contacts.
+        """
+        query = orjson.dumps([skip, limit, name, surname, email, q, after])
+        cache_key = f"contacts:{user.id}:list:{hashlib.blake2b(query, digest_size=16).hexdigest()}"
+
+        async def load() -> bytes:
+            return dump_contacts(
+                await self.get_contacts(skip, limit, user, name, surname, email, q, after)
+            )
+
+        return await self.cache.get_or_set(cache_key, settings.CONTACTS_CACHE_TTL, load)
+
     async def get_contact(self, contact_id: int, user: User):
         """
         Retrieves a single contact by ID for the user.
@@ -111,10 +218,31 @@ class ContactService:
         Returns:
             Contact: The contact with the provided ID.
         """
-        return await self._ensure_exists(
-            lambda: self.contact_repository.get_contact_by_id(contact_id, user),
-            f"Contact with ID {contact_id} not found",
-            status.HTTP_404_NOT_FOUND,
+        contact = await self.contact_repository.get_contact_by_id(contact_id, user)
+        if contact is None:
+            raise self._contact_not_found(contact_id)
+        return contact
+
+    async def get_contact_json(self, contact_id: int, user: User) -> bytes:
+        """
+        Retrieves a single contact as a serialized JSON response, served from the cache when possible.
+
+        Args:
+            contact_id (int): The ID of the contact to retrieve.
+            user (User): The user whose contact to retrieve.
+
+        Raises:
+            HTTPException: If the contact with the provided ID does not exist.
+
+        Returns:
+            bytes: The JSON-encoded contact.
+        """
+
+        async def load() -> bytes:
+            return dump_contact(await self.get_contact(contact_id, user))
+
+        return await self.cache.get_or_set(
+            f"contacts:{user.id}:contact:{contact_id}", settings.CONTACTS_CACHE_TTL, load
         )
 
     async def update_contact(self, contact_id: int, body: ContactUpdate, user: User):
@@ -132,11 +260,11 @@ class ContactService:
         Returns:
             Contact: The updated contact.
         """
-        contact = await self.get_contact(contact_id, user)
-        updated_contact = await self.contact_repository.update_contact(
-            contact.id, body, user
-        )
-        logger.info(f"Contact updated: ID {contact_id}")
+        updated_contact = await self.contact_repository.update_contact(contact_id, body, user)
+        if updated_contact is None:
+            raise self._contact_not_found(contact_id)
+        await self._invalidate_cache(user)
+        logger.info("Contact updated: ID %s", contact_id)
         return updated_contact
 
     async def remove_contact(self, contact_id: int, user: User):
@@ -153,9 +281,11 @@ class ContactService:
         Returns:
             None
         """
-        contact = await self.get_contact(contact_id, user)
-        await self.contact_repository.remove_contact(contact.id, user)
-        logger.info(f"Contact removed: ID {contact_id}")
+        removed_contact = await self.contact_repository.remove_contact(contact_id, user)
+        if removed_contact is None:
+            raise self._contact_not_found(contact_id)
+        await self._invalidate_cache(user)
+        logger.info("Contact removed: ID %s", contact_id)
 
     async def get_upcoming_birthdays(self, user: User, days: int = 7):
         """
@@ -169,7 +299,30 @@ class ContactService:
             List[Contact]: A list of contacts with upcoming birthdays.
         """
         contacts = await self.contact_repository.get_upcoming_birthdays(user, days)
-        logger.info(
-            f"Retrieved {len(contacts)} upcoming birthdays for user: {user}"
-        )
-        return contacts
\ No newline at end of file
+        logger.info("Retrieved %d upcoming birthdays for user: %s", len(contacts), user)
+        return contacts
+
+    async def get_upcoming_birthdays_json(self, user: User, days: int = 7) -> bytes:
+        """
+        Retrieves the upcoming birthdays as a serialized JSON response, served from the cache when possible.
+
+        The result only changes when the date does or when a contact is modified, so
+        it is cached per day until midnight and dropped with the other contact reads.
+
+        Args:
+            user (User): The user whose contacts to retrieve.
+            days (int): The number of days to look ahead for upcoming birthdays.
+
+        Returns:
+            bytes: The JSON-encoded list of contacts with upcoming birthdays.
+        """
+
+        async def load() -> bytes:
+            return dump_contacts(await self.get_upcoming_birthdays(user, days))
+
+        now = datetime.now()
+        return await self.cache.get_or_set(
+            f"contacts:{user.id}:birthdays:{days}:{now.date().isoformat()}",
+            seconds_until_midnight(now),
+            load,
+        )
\ No newline at end of file
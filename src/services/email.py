@@ -1,13 +1,37 @@
+import logging
 from pathlib import Path
 
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
 from fastapi_mail.errors import ConnectionErrors
+from jinja2 import Environment, FileSystemLoader
 from pydantic import EmailStr
 
 from src.services.auth import create_email_token
 from src.conf.config import settings
 
-conf = ConnectionConfig(
+logger = logging.getLogger(__name__)
+
+TEMPLATE_FOLDER = Path(__file__).parent / "templates"
+TEMPLATE_NAMES = ("verify_email.html", "reset_password.html", "new_password.html")
+
+# Compiled once at import, so the first email sent by a worker skips template parsing
+template_env = Environment(loader=FileSystemLoader(TEMPLATE_FOLDER))
+for template_name in TEMPLATE_NAMES:
+    template_env.get_template(template_name)
+
+
+class MailConfig(ConnectionConfig):
+    def template_engine(self) -> Environment:
+        """
+        Returns the shared template environment.
+
+        ``ConnectionConfig`` builds a new environment on every call, which
+        throws away the compiled templates after each send.
+        """
+        return template_env
+
+
+conf = MailConfig(
     MAIL_USERNAME=settings.MAIL_USERNAME,
     MAIL_PASSWORD=settings.MAIL_PASSWORD,
     MAIL_FROM=settings.MAIL_FROM,
@@ -18,9 +42,11 @@ conf = ConnectionConfig(
     MAIL_SSL_TLS=settings.MAIL_SSL_TLS,
     USE_CREDENTIALS=settings.USE_CREDENTIALS,
     VALIDATE_CERTS=settings.VALIDATE_CERTS,
-    TEMPLATE_FOLDER=Path(__file__).parent / "templates",
+    TEMPLATE_FOLDER=TEMPLATE_FOLDER,
 )
 
+fm = FastMail(conf)
+
 async def send_email(email: EmailStr, username: str, host: str):
     """
     Sends an email to a user with a link to verify their email address.
@@ -46,10 +72,9 @@ async def send_email(email: EmailStr, username: str, host: str):
             subtype=MessageType.html,
         )
 
-        fm = FastMail(conf)
         await fm.send_message(message, template_name="verify_email.html")
-    except ConnectionErrors as e:
-        print(e)
+    except ConnectionErrors:
+        logger.exception("Failed to send verification email to user %s", username)
 
 async def send_reset_password_email(email: EmailStr, username: str, host: str, token: str):
     """
@@ -76,10 +101,9 @@ async def send_reset_password_email(email: EmailStr, username: str, host: str, t
             subtype=MessageType.html,
         )
 
-        fm = FastMail(conf)
         await fm.send_message(message, template_name="reset_password.html")
-    except ConnectionErrors as e:
-        print(e)
+    except ConnectionErrors:
+        logger.exception("Failed to send password reset email to user %s", username)
 
 async def send_new_password_email(email: EmailStr, username: str, new_password: str):
     """Sends an email to a user with their new password.
@@ -103,8 +127,7 @@ async def send_new_password_email(email: EmailStr, username: str, new_password:
             subtype=MessageType.html,
         )
 
-        fm = FastMail(conf)
         await fm.send_message(message, template_name="new_password.html")
 
-    except ConnectionErrors as e:
-        print(e)
\ No newline at end of file
+    except ConnectionErrors:
+        logger.exception("Failed to send new password email to user %s", username)
\ No newline at end of file
@@ -0,0 +1,179 @@
+import logging
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Deque, Dict
+
+import redis.asyncio as redis
+from fastapi import Depends, Request
+
+from src.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on the client/path pairs tracked in-process by one limiter
+RATE_LIMIT_MAX_KEYS = 10_000
+
+# Used in place of the client address when the server does not report one
+DEFAULT_CLIENT_HOST = "127.0.0.1"
+
+# Drops hits that left the window, records the new ones and returns the number
+# of hits in the window, all in one atomic round trip.
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local hits = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+for i = 1, hits do
+    redis.call('ZADD', key, now, ARGV[4] .. ':' .. i)
+end
+redis.call('PEXPIRE', key, window)
+return redis.call('ZCARD', key)
+"""
+
+
+class RateLimitExceeded(Exception):
+    pass
+
+
+class LocalTokenBucket:
+    def __init__(self, rate: int, per: float):
+        """
+        Initialize an in-process sliding window of recent hits.
+
+        Args:
+            rate (int): The number of hits allowed per window.
+            per (float): The window length in seconds.
+        """
+        self.rate = rate
+        self.per = per
+        self.hits: Deque[float] = deque()
+
+    def count(self, now: float) -> int:
+        """
+        Returns the number of hits inside the window ending at ``now``.
+
+        Args:
+            now (float): The current timestamp in seconds.
+
+        Returns:
+            int: The number of hits in the window.
+        """
+        while self.hits and self.hits[0] <= now - self.per:
+            self.hits.popleft()
+        return len(self.hits)
+
+    def hit(self, now: float) -> None:
+        """
+        Records a hit at ``now``.
+
+        Args:
+            now (float): The current timestamp in seconds.
+        """
+        self.hits.append(now)
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        times: int,
+        seconds: int,
+        sync_interval: float = 5.0,
+        max_keys: int = RATE_LIMIT_MAX_KEYS,
+    ):
+        """
+        Initialize a two-tier sliding window rate limiter.
+
+        Every worker first counts hits in a local bucket, which answers the
+        common case without network I/O. The hits are reconciled with a shared
+        Redis sorted set once the local bucket reaches half of the limit or
+        ``sync_interval`` seconds after the previous reconciliation. At most
+        ``max_keys`` buckets are kept, the least recently used one is dropped first.
+
+        Args:
+            times (int): The number of requests allowed per window.
+            seconds (int): The window length in seconds.
+            sync_interval (float): The maximum time between two Redis reconciliations.
+            max_keys (int): The maximum number of local buckets kept in memory.
+        """
+        self.times = times
+        self.seconds = seconds
+        self.sync_interval = sync_interval
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, LocalTokenBucket]" = OrderedDict()
+        self._pending: Dict[str, int] = {}
+        self._last_sync: Dict[str, float] = {}
+        self._script = None
+
+    def _get_script(self, redis_client: redis.Redis):
+        """
+        Returns the sliding window script registered with the given client.
+
+        The script is sent to Redis once and then invoked by its SHA.
+        """
+        if self._script is None or self._script.registered_client is not redis_client:
+            self._script = redis_client.register_script(SLIDING_WINDOW_SCRIPT)
+        return self._script
+
+    def _get_bucket(self, key: str) -> LocalTokenBucket:
+        """
+        Returns the local bucket for ``key``, evicting the least recently used one when full.
+        """
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = LocalTokenBucket(self.times, self.seconds)
+            if len(self._buckets) > self.max_keys:
+                evicted, _ = self._buckets.popitem(last=False)
+                self._pending.pop(evicted, None)
+                self._last_sync.pop(evicted, None)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket
+
+    async def _sync(self, redis_client: redis.Redis, key: str, now: float) -> int:
+        """
+        Pushes the pending local hits to Redis and returns the shared hit count.
+        """
+        pending = self._pending.pop(key, 0)
+        self._last_sync[key] = now
+        script = self._get_script(redis_client)
+        return await script(
+            keys=[key],
+            args=[int(now * 1000), self.seconds * 1000, pending, uuid.uuid4().hex],
+        )
+
+    async def __call__(self, request: Request, redis_client=Depends(get_redis)) -> None:
+        """
+        FastAPI dependency that rejects requests above the limit.
+
+        Args:
+            request (Request): The incoming request, keyed by client address and path.
+            redis_client (redis.asyncio.Redis): The Redis client holding the shared counters.
+
+        Raises:
+            RateLimitExceeded: If the client exceeded the limit.
+        """
+        host = request.client.host if request.client else DEFAULT_CLIENT_HOST
+        key = f"rate_limit:{request.url.path}:{host}"
+        now = time.time()
+        bucket = self._get_bucket(key)
+
+        local_count = bucket.count(now)
+        if local_count >= self.times:
+            raise RateLimitExceeded()
+        bucket.hit(now)
+        self._pending[key] = self._pending.get(key, 0) + 1
+
+        near_quota = local_count + 1 >= self.times // 2
+        stale = now - self._last_sync.get(key, 0.0) >= self.sync_interval
+        if not (near_quota or stale):
+            return
+
+        try:
+            shared_count = await self._sync(redis_client, key, now)
+        except redis.RedisError as e:
+            logger.warning("Rate limit sync failed, using local counters: %s", e)
+            return
+        if shared_count > self.times:
+            raise RateLimitExceeded()
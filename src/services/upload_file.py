@@ -1,9 +1,11 @@
 import cloudinary
 import cloudinary.uploader
+import cloudinary.utils
+import httpx
 import logging
-from typing import BinaryIO, Any
+import time
+from typing import BinaryIO, Any, Optional, Union
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +21,10 @@ class UploadFileService:
         self.cloud_name = cloud_name
         self.api_key = api_key
         self.api_secret = api_secret
+        self.upload_url = f"https://api.cloudinary.com/v1_1/{cloud_name}/image/upload"
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100), timeout=30
+        )
         cloudinary.config(
             cloud_name=self.cloud_name,
             api_key=self.api_key,
@@ -55,11 +61,58 @@ class UploadFileService:
 
         public_id = f"RestApp/{username}"
         try:
-            logger.info(f"Uploading file for user: {username} with public_id: {public_id}")
+            logger.info("Uploading file for user: %s with public_id: %s", username, public_id)
             result = cloudinary.uploader.upload(file.file, public_id=public_id, overwrite=True)
             src_url = UploadFileService._build_url(public_id, version=result.get("version"))
-            logger.info(f"File uploaded successfully. URL: {src_url}")
+            logger.info("File uploaded successfully. URL: %s", src_url)
+            return src_url
+        except Exception as e:
+            logger.error("Failed to upload file for user %s: %s", username, e)
+            raise RuntimeError(f"File upload failed: {e}")
+
+    async def upload_file_async(
+        self,
+        file: Union[bytes, BinaryIO],
+        username: str,
+        content_type: Optional[str] = None,
+    ) -> str:
+        """
+        Uploads a file to Cloudinary over a pooled async HTTP connection and returns the URL of the uploaded image.
+
+        The signed upload request is sent without blocking the event loop, so other
+        requests keep being served while the upload is in flight.
+
+        :param file: The file content or a binary file object to upload.
+        :param username: The username of the user to associate the file with.
+        :param content_type: The MIME type of the file, if known.
+        :return: The URL of the uploaded image.
+        :raises ValueError: If the file or username is invalid.
+        :raises RuntimeError: If the file upload fails.
+        """
+        if not file or not username:
+            raise ValueError("Invalid file or username.")
+
+        public_id = f"RestApp/{username}"
+        params = {"public_id": public_id, "overwrite": "true", "timestamp": int(time.time())}
+        params["signature"] = cloudinary.utils.api_sign_request(params, self.api_secret)
+        params["api_key"] = self.api_key
+        try:
+            logger.info("Uploading file for user: %s with public_id: %s", username, public_id)
+            response = await self.http_client.post(
+                self.upload_url,
+                data=params,
+                files={"file": (username, file, content_type)},
+            )
+            response.raise_for_status()
+            src_url = UploadFileService._build_url(public_id, version=response.json().get("version"))
+            logger.info("File uploaded successfully. URL: %s", src_url)
             return src_url
         except Exception as e:
-            logger.error(f"Failed to upload file for user {username}: {e}")
-            raise RuntimeError(f"File upload failed: {e}")
\ No newline at end of file
+            logger.error("Failed to upload file for user %s: %s", username, e)
+            raise RuntimeError(f"File upload failed: {e}")
+
+    async def close(self) -> None:
+        """
+        Closes the pooled HTTP connections used for async uploads.
+        """
+        await self.http_client.aclose()
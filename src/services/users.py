@@ -1,3 +1,7 @@
+import logging
+
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from libgravatar import Gravatar
@@ -5,6 +9,8 @@ from libgravatar import Gravatar
 from src.repository.users import UserRepository
 from src.schemas import UserCreate
 
+logger = logging.getLogger(__name__)
+
 
 class UserService:
     def __init__(self, db: AsyncSession):
@@ -20,9 +26,16 @@ class UserService:
         """
         Creates a new user with the given data and a default avatar URL using Gravatar.
 
+        The insert relies on the unique constraints of the users table, so the
+        happy path takes a single round trip; the conflicting field is only
+        looked up when the insert is rejected.
+
         Args:
             body (UserCreate): The data required to create a new user, including username, email, and password.
 
+        Raises:
+            HTTPException: If a user with the given email or username already exists.
+
         Returns:
             User: The newly created user object.
         """
@@ -30,10 +43,20 @@ class UserService:
         try:
             g = Gravatar(body.email)
             avatar = g.get_image()
-        except Exception as e:
-            print(e)
+        except Exception:
+            logger.exception("Gravatar lookup failed for user %s", body.username)
 
-        return await self.repository.create_user(body, avatar)
+        try:
+            return await self.repository.create_user(body, avatar)
+        except IntegrityError:
+            existing_users = await self.get_users_by_email_or_username(
+                body.email, body.username
+            )
+            if any(user.email == body.email for user in existing_users):
+                detail = "A user with this email already exists."
+            else:
+                detail = "A user with this username already exists."
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
 
     async def get_user_by_id(self, user_id: int):
         """
@@ -60,6 +83,18 @@ class UserService:
         """
         return await self.repository.get_user_by_username(username, refresh_token)
 
+    async def get_user_auth_projection(self, username: str):
+        """
+        Retrieves only the user fields needed to authenticate a request.
+
+        Args:
+            username (str): The username of the user to retrieve.
+
+        Returns:
+            User | None: A detached user with id, username, email, avatar and role if found, otherwise None.
+        """
+        return await self.repository.get_user_auth_projection(username)
+
     async def get_user_by_email(self, email: str):
         """
         Retrieves a user by their email address.
@@ -72,6 +107,19 @@ class UserService:
         """
         return await self.repository.get_user_by_email(email)
 
+    async def get_users_by_email_or_username(self, email: str, username: str):
+        """
+        Retrieves users matching either the given email address or username.
+
+        Args:
+            email (str): The email address to match.
+            username (str): The username to match.
+
+        Returns:
+            List[User]: The users matching the email or the username.
+        """
+        return await self.repository.get_users_by_email_or_username(email, username)
+
     async def confirmed_email(self, email: str):
         """
         Marks a user's email as confirmed.
@@ -95,11 +143,7 @@ class UserService:
         Raises:
             ValueError: If the user is not found.
         """
-        user = await self.repository.get_user_by_email(email)
-        if not user:
-            raise ValueError("User not found")
-        user.hashed_password = hashed_password
-        await self.repository.update_user(user)
+        await self.repository.update_password_by_email(email, hashed_password)
 
     async def update_avatar_url(self, email: str, url: str):
         """
@@ -1,11 +1,17 @@
 import asyncio
+import os
+
+# The cheapest bcrypt cost keeps hashing out of the test run time; set before
+# the settings are first loaded
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
 
 import pytest
 import pytest_asyncio
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.pool import StaticPool
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 from main import app
 from src.database.models import Base, User
@@ -17,7 +23,9 @@ from src.services.auth import (
     create_refresh_token,
 )
 
-SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+# Named shared-cache in-memory database: StaticPool keeps its one connection open
+# for the whole run, and every engine in the process sees the same tables.
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///file:testdb?mode=memory&cache=shared&uri=true"
 
 engine = create_async_engine(
     SQLALCHEMY_DATABASE_URL,
@@ -36,19 +44,31 @@ test_user = {
     "role": "user",
 }
 
+# bcrypt is deliberately slow, so the test user's hash is computed once per run
+HASHED_TEST_PASSWORD = Hash.pwd_context.hash(test_user["password"])
+
+
+@pytest.fixture(scope="session")
+def create_schema():
+    async def create_all():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_all())
+
 
 @pytest.fixture(scope="module", autouse=True)
-def init_models_wrap():
+def init_models_wrap(create_schema):
+    # The schema is created once per run; each module starts from emptied tables
     async def init_models():
         async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.drop_all)
-            await conn.run_sync(Base.metadata.create_all)
+            for table in reversed(Base.metadata.sorted_tables):
+                await conn.execute(table.delete())
         async with TestingSessionLocal() as session:
-            hash_password = Hash().get_password_hash(test_user["password"])
             current_user = User(
                 username=test_user["username"],
                 email=test_user["email"],
-                hashed_password=hash_password,
+                hashed_password=HASHED_TEST_PASSWORD,
                 confirmed=True,
                 avatar="<https://twitter.com/gravatar>",
             )
@@ -60,8 +80,8 @@ def init_models_wrap():
     asyncio.run(init_models())
 
 
-@pytest.fixture(scope="module")
-def client():
+@pytest_asyncio.fixture()
+async def client():
     # Dependency override
 
     async def override_get_db():
@@ -75,22 +95,59 @@ def client():
 
     app.dependency_overrides[get_db] = override_get_db
 
-    yield TestClient(app)
+    # Requests run on the test's own event loop instead of a new thread and loop per call
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://testserver", follow_redirects=True
+    ) as async_client:
+        yield async_client
 
 
-@pytest_asyncio.fixture()
+@pytest.fixture(scope="session", autouse=True)
+def mail_senders():
+    """Replaces the email senders of the auth routes once for the whole run."""
+    senders = {
+        name: Mock()
+        for name in ("send_email", "send_reset_password_email", "send_new_password_email")
+    }
+    with pytest.MonkeyPatch.context() as mp:
+        for name, sender in senders.items():
+            mp.setattr(f"src.api.auth.{name}", sender)
+        yield senders
+
+
+@pytest.fixture(autouse=True)
+def reset_mail_senders(mail_senders):
+    for sender in mail_senders.values():
+        sender.reset_mock()
+
+
+@pytest.fixture()
+def query_counter():
+    """Collects the SQL statements sent to the test database."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+# Tokens carry no per-test state, so they are issued once per run
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def get_access_token():
     token = await create_access_token(data={"sub": test_user["username"]})
     return token
 
 
-@pytest_asyncio.fixture()
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def get_refresh_token():
     token = await create_refresh_token(data={"sub": test_user["username"]})
     return token
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def get_email_token():
     token = create_email_token(data={"sub": test_user["email"]})
     return token
@@ -102,8 +159,17 @@ def mock_redis(monkeypatch):
     # Create a mock Redis client
     mock_redis_client = AsyncMock()
     mock_redis_client.get.return_value = None  # Redis cache does not exist
+    mock_redis_client.getex.return_value = None
     mock_redis_client.set.return_value = True  # Redis cache is set
 
+    async def scan_iter(*args, **kwargs):  # Redis cache holds no keys
+        for key in ():
+            yield key
+
+    mock_redis_client.scan_iter = scan_iter
+    # Rate limit script reports a single hit in the window
+    mock_redis_client.register_script = MagicMock(return_value=AsyncMock(return_value=1))
+
     # Change redis_client global variable
     monkeypatch.setattr("src.redis.redis_client", mock_redis_client)
 
@@ -0,0 +1,206 @@
+import fakeredis
+import pytest
+from collections import OrderedDict
+from unittest.mock import AsyncMock, MagicMock
+
+from src.database.models import User
+from jose import JWTError, jwt
+import orjson
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+from src.services.auth import (
+    USER_CACHE_MISS,
+    Hash,
+    create_access_token,
+    decode_token_cached,
+    get_current_user,
+    verify_password_cached,
+)
+
+
+@pytest.fixture
+def redis_client():
+    client = AsyncMock()
+    client.get.return_value = None
+    client.getex.return_value = None
+    return client
+
+
+@pytest.fixture(autouse=True)
+def decoded_tokens(monkeypatch):
+    cache = OrderedDict()
+    monkeypatch.setattr("src.services.auth._decoded_tokens", cache)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def verified_passwords(monkeypatch):
+    cache = OrderedDict()
+    monkeypatch.setattr("src.services.auth._verified_passwords", cache)
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_verify_password_cached_hit_skips_bcrypt(redis_client, monkeypatch):
+    mock_verify = AsyncMock()
+    monkeypatch.setattr("src.services.auth.Hash.verify_password", mock_verify)
+    redis_client.get.return_value = b"hashed"
+
+    result = await verify_password_cached(redis_client, "user", "secret", "hashed")
+
+    assert result is True
+    mock_verify.assert_not_awaited()
+    redis_client.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_verify_password_cached_stores_success(redis_client, monkeypatch):
+    monkeypatch.setattr(
+        "src.services.auth.Hash.verify_password", AsyncMock(return_value=True)
+    )
+
+    result = await verify_password_cached(redis_client, "user", "secret", "hashed")
+
+    assert result is True
+    redis_client.set.assert_awaited_once()
+    key, value = redis_client.set.await_args.args
+    assert key.startswith("pwcache:")
+    assert "secret" not in key
+    assert value == "hashed"
+
+
+@pytest.mark.asyncio
+async def test_verify_password_cached_ignores_stale_hash(redis_client, monkeypatch):
+    mock_verify = AsyncMock(return_value=False)
+    monkeypatch.setattr("src.services.auth.Hash.verify_password", mock_verify)
+    redis_client.get.return_value = b"old_hash"
+
+    result = await verify_password_cached(redis_client, "user", "secret", "hashed")
+
+    assert result is False
+    mock_verify.assert_awaited_once()
+    redis_client.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_verify_password_cached_local_hit_skips_redis(redis_client, monkeypatch):
+    mock_verify = AsyncMock(return_value=True)
+    monkeypatch.setattr("src.services.auth.Hash.verify_password", mock_verify)
+
+    await verify_password_cached(redis_client, "user", "secret", "hashed")
+    result = await verify_password_cached(redis_client, "user", "secret", "hashed")
+
+    assert result is True
+    mock_verify.assert_awaited_once()
+    redis_client.get.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_verify_password_cached_local_entry_bounded(
+    redis_client, monkeypatch, verified_passwords
+):
+    monkeypatch.setattr(
+        "src.services.auth.Hash.verify_password", AsyncMock(return_value=True)
+    )
+    monkeypatch.setattr("src.services.auth.VERIFIED_PASSWORDS_MAXSIZE", 2)
+
+    for password in ("one", "two", "three"):
+        await verify_password_cached(redis_client, "user", password, "hashed")
+
+    assert len(verified_passwords) == 2
+
+
+@pytest.mark.asyncio
+async def test_hash_needs_update_for_other_cost_factor():
+    hasher = Hash()
+    legacy_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=5).hash("secret")
+
+    assert hasher.needs_update(legacy_hash) is True
+    assert hasher.needs_update(await hasher.get_password_hash("secret")) is False
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_cache_ttl_bounded_by_token(redis_client, monkeypatch):
+    user = User(id=1, username="user", email="user@example.com", avatar="avatar", role=None)
+    monkeypatch.setattr(
+        "src.services.auth.UserService.get_user_auth_projection", AsyncMock(return_value=user)
+    )
+    token = await create_access_token(data={"sub": "user"}, expires_delta=100)
+
+    result = await get_current_user(token, AsyncMock(), redis_client)
+
+    assert result is user
+    ttl = redis_client.set.await_args.kwargs["ex"]
+    assert 0 < ttl <= 100
+
+
+@pytest.mark.asyncio
+async def test_decode_token_cached_verifies_once(monkeypatch):
+    token = await create_access_token(data={"sub": "user"})
+    decode = MagicMock(wraps=jwt.decode)
+    monkeypatch.setattr("src.services.auth.jwt.decode", decode)
+
+    first = decode_token_cached(token)
+    second = decode_token_cached(token)
+
+    assert first == second
+    assert first["sub"] == "user"
+    decode.assert_called_once()
+
+
+def test_decode_token_cached_rejects_invalid_token(decoded_tokens):
+    with pytest.raises(JWTError):
+        decode_token_cached("not-a-token")
+    assert not decoded_tokens
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_cache_hit_refreshes_ttl(redis_client):
+    redis_client.getex.return_value = orjson.dumps(
+        {"id": 1, "username": "user", "email": "user@example.com", "avatar": "avatar", "role": None}
+    )
+    token = await create_access_token(data={"sub": "user"}, expires_delta=100)
+    db = AsyncMock()
+
+    result = await get_current_user(token, db, redis_client)
+
+    assert result.username == "user"
+    key = redis_client.getex.await_args.args[0]
+    assert key == "user:user"
+    assert 0 < redis_client.getex.await_args.kwargs["ex"] <= 100
+    db.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_caches_missing_user(redis_client, monkeypatch):
+    lookup = AsyncMock(return_value=None)
+    monkeypatch.setattr("src.services.auth.UserService.get_user_auth_projection", lookup)
+    token = await create_access_token(data={"sub": "ghost"})
+
+    with pytest.raises(HTTPException):
+        await get_current_user(token, AsyncMock(), redis_client)
+    redis_client.set.assert_awaited_once_with("user_miss:ghost", USER_CACHE_MISS, ex=30)
+
+    redis_client.get.return_value = USER_CACHE_MISS
+    with pytest.raises(HTTPException):
+        await get_current_user(token, AsyncMock(), redis_client)
+    lookup.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_miss_hit_keeps_its_ttl(monkeypatch):
+    redis_client = fakeredis.FakeAsyncRedis()
+    lookup = AsyncMock(return_value=None)
+    monkeypatch.setattr("src.services.auth.UserService.get_user_auth_projection", lookup)
+    token = await create_access_token(data={"sub": "ghost"}, expires_delta=3600)
+
+    with pytest.raises(HTTPException):
+        await get_current_user(token, AsyncMock(), redis_client)
+    await redis_client.expire("user_miss:ghost", 5)
+    with pytest.raises(HTTPException):
+        await get_current_user(token, AsyncMock(), redis_client)
+
+    assert 0 < await redis_client.ttl("user_miss:ghost") <= 5
+    assert not await redis_client.exists("user:ghost")
+    lookup.assert_awaited_once()
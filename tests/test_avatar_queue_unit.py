@@ -0,0 +1,115 @@
+import asyncio
+import contextlib
+import hashlib
+
+import orjson
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.services.avatar_queue import AvatarUploadQueue
+
+
+@pytest.fixture
+def upload_service():
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_user_service(monkeypatch):
+    @contextlib.asynccontextmanager
+    async def session():
+        yield AsyncMock()
+
+    user_service = MagicMock()
+    user_service.update_avatar_url = AsyncMock()
+    monkeypatch.setattr("src.services.avatar_queue.sessionmanager.session", session)
+    monkeypatch.setattr(
+        "src.services.avatar_queue.UserService", MagicMock(return_value=user_service)
+    )
+    monkeypatch.setattr("src.services.avatar_queue.asyncio.sleep", AsyncMock())
+    return user_service
+
+
+@pytest.mark.asyncio
+async def test_process_retries_failed_upload(upload_service, mock_user_service, mock_redis):
+    upload_service.upload_file_async = AsyncMock(
+        side_effect=[RuntimeError("timeout"), "http://example.com/avatar.jpg"]
+    )
+    avatar_queue = AvatarUploadQueue(upload_service)
+
+    await avatar_queue._process("test@email.com", "testuser", b"image", "image/jpeg")
+
+    assert upload_service.upload_file_async.await_count == 2
+    mock_user_service.update_avatar_url.assert_awaited_once_with(
+        "test@email.com", "http://example.com/avatar.jpg"
+    )
+    mock_redis.delete.assert_awaited_once_with("user:testuser", "user_miss:testuser")
+
+
+@pytest.mark.asyncio
+async def test_process_gives_up_after_retries(upload_service, mock_user_service):
+    upload_service.upload_file_async = AsyncMock(side_effect=RuntimeError("down"))
+    avatar_queue = AvatarUploadQueue(upload_service, retries=3)
+
+    with pytest.raises(RuntimeError):
+        await avatar_queue._process("test@email.com", "testuser", b"image", "image/jpeg")
+
+    assert upload_service.upload_file_async.await_count == 3
+    mock_user_service.update_avatar_url.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_process_same_image_skips_upload(upload_service, mock_user_service, mock_redis):
+    mock_redis.get.return_value = orjson.dumps(
+        {"sha256": hashlib.sha256(b"image").hexdigest(), "url": "http://example.com/old.jpg"}
+    )
+    upload_service.upload_file_async = AsyncMock()
+    avatar_queue = AvatarUploadQueue(upload_service)
+
+    await avatar_queue._process("test@email.com", "testuser", b"image", "image/jpeg")
+
+    upload_service.upload_file_async.assert_not_awaited()
+    mock_user_service.update_avatar_url.assert_awaited_once_with(
+        "test@email.com", "http://example.com/old.jpg"
+    )
+
+
+@pytest.mark.asyncio
+async def test_enqueue_rejects_when_queue_is_full(upload_service):
+    avatar_queue = AvatarUploadQueue(upload_service, maxsize=1)
+
+    await avatar_queue.enqueue("test@email.com", "testuser", b"image", "image/jpeg")
+    with pytest.raises(asyncio.QueueFull):
+        await avatar_queue.enqueue("test@email.com", "testuser", b"image", "image/jpeg")
+
+
+@pytest.mark.asyncio
+async def test_stop_finishes_queued_uploads(upload_service, monkeypatch):
+    process = AsyncMock()
+    avatar_queue = AvatarUploadQueue(upload_service, workers=1)
+    monkeypatch.setattr(avatar_queue, "_process", process)
+
+    await avatar_queue.start()
+    for _ in range(3):
+        await avatar_queue.enqueue("test@email.com", "testuser", b"image", "image/jpeg")
+    await avatar_queue.stop()
+
+    assert process.await_count == 3
+    assert not avatar_queue._tasks
+
+
+@pytest.mark.asyncio
+async def test_stop_logs_dropped_uploads_after_timeout(upload_service, monkeypatch, caplog):
+    async def hang(*args):
+        await asyncio.Event().wait()
+
+    avatar_queue = AvatarUploadQueue(upload_service, workers=1)
+    monkeypatch.setattr(avatar_queue, "_process", hang)
+
+    await avatar_queue.start()
+    for _ in range(3):
+        await avatar_queue.enqueue("test@email.com", "testuser", b"image", "image/jpeg")
+    await asyncio.sleep(0)
+    await avatar_queue.stop(timeout=0.01)
+
+    assert "Dropping 2 queued avatar uploads" in caplog.text
@@ -0,0 +1,120 @@
+from datetime import date, datetime
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.services.cache import CacheService
+from src.services.contacts import ContactService, seconds_until_midnight
+from src.schemas import User, UserRole
+
+
+@pytest.fixture
+def redis_client():
+    client = AsyncMock()
+    client.get.return_value = None
+    return client
+
+
+@pytest.fixture
+def user():
+    return User(
+        id=1,
+        username="testuser",
+        email="test@email.com",
+        avatar="avatar",
+        role=UserRole.USER,
+    )
+
+
+@pytest.mark.asyncio
+async def test_set_stores_value_with_ttl(redis_client):
+    cache = CacheService(redis_client)
+
+    await cache.set("key", b"value", 30)
+
+    redis_client.set.assert_awaited_once_with("key", b"value", ex=30)
+
+
+@pytest.mark.asyncio
+async def test_invalidate_unlinks_matching_keys(redis_client):
+    async def scan_iter(match, count):
+        for key in (b"contacts:1:a", b"contacts:1:b"):
+            yield key
+
+    redis_client.scan_iter = scan_iter
+    cache = CacheService(redis_client)
+
+    await cache.invalidate("contacts:1:*")
+
+    redis_client.unlink.assert_awaited_once_with(b"contacts:1:a", b"contacts:1:b")
+
+
+@pytest.mark.asyncio
+async def test_invalidate_without_matches_skips_unlink(redis_client):
+    async def scan_iter(match, count):
+        for key in ():
+            yield key
+
+    redis_client.scan_iter = scan_iter
+    cache = CacheService(redis_client)
+
+    await cache.invalidate("contacts:1:*")
+
+    redis_client.unlink.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_upcoming_birthdays_cache_hit_skips_db(redis_client, user):
+    redis_client.get.return_value = b"[]"
+    contact_service = ContactService(AsyncMock(), CacheService(redis_client))
+    contact_service.contact_repository.get_upcoming_birthdays = AsyncMock()
+
+    result = await contact_service.get_upcoming_birthdays_json(user, 7)
+
+    assert result == b"[]"
+    key = f"contacts:1:birthdays:7:{date.today().isoformat()}"
+    redis_client.get.assert_awaited_once_with(key)
+    contact_service.contact_repository.get_upcoming_birthdays.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_miss_loads_and_stores(redis_client):
+    cache = CacheService(redis_client)
+    loader = AsyncMock(return_value=b"value")
+
+    result = await cache.get_or_set("key", 30, loader)
+
+    assert result == b"value"
+    loader.assert_awaited_once()
+    redis_client.set.assert_awaited_once_with("key", b"value", ex=30)
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_hit_skips_loader(redis_client):
+    redis_client.get.return_value = b"cached"
+    cache = CacheService(redis_client)
+    loader = AsyncMock()
+
+    result = await cache.get_or_set("key", 30, loader)
+
+    assert result == b"cached"
+    loader.assert_not_awaited()
+    redis_client.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_contact_cache_hit_skips_db(redis_client, user):
+    redis_client.get.return_value = b"{}"
+    contact_service = ContactService(AsyncMock(), CacheService(redis_client))
+    contact_service.contact_repository.get_contact_by_id = AsyncMock()
+
+    result = await contact_service.get_contact_json(3, user)
+
+    assert result == b"{}"
+    redis_client.get.assert_awaited_once_with("contacts:1:contact:3")
+    contact_service.contact_repository.get_contact_by_id.assert_not_awaited()
+
+
+def test_seconds_until_midnight():
+    assert seconds_until_midnight(datetime(2024, 1, 1, 23, 59, 0)) == 60
+    assert seconds_until_midnight(datetime(2024, 1, 1, 0, 0, 0)) == 86400
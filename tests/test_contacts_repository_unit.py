@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.repository.contacts import ContactRepository
 
@@ -8,6 +8,35 @@ from src.schemas import ContactUpdate, ContactCreate
 from datetime import datetime, date
 
 
+class ScalarResult:
+    """Plain stand-in for the result of an executed statement."""
+
+    def __init__(self, scalar=None, many=()):
+        self.scalar = scalar
+        self.many = list(many)
+
+    def scalar_one_or_none(self):
+        return self.scalar
+
+    def scalar_one(self):
+        return self.scalar
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.many
+
+
+class AsyncScalarResult:
+    def __init__(self, items):
+        self.items = items
+
+    async def __aiter__(self):
+        for item in self.items:
+            yield item
+
+
 @pytest.fixture
 def mock_session():
     return AsyncMock(spec=AsyncSession)
@@ -18,16 +47,16 @@ def contact_repository(mock_session):
     return ContactRepository(mock_session)
 
 
-@pytest.fixture
+# The repository only reads the user and the sample contact, so one instance
+# of each serves the whole module
+@pytest.fixture(scope="module")
 def user():
     return User(id=0, username="testuser", email="test@email.com", avatar="avatar")
 
 
-@pytest.mark.asyncio
-async def test_get_contact_by_id(contact_repository, mock_session, user):
-    # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = Contact(
+@pytest.fixture(scope="module")
+def sample_contact(user):
+    return Contact(
         id=0,
         name="John",
         surname="Doe",
@@ -36,7 +65,17 @@ async def test_get_contact_by_id(contact_repository, mock_session, user):
         birthday=datetime(2012, 1, 15, 12, 0, 0),
         user=user,
     )
-    mock_session.execute = AsyncMock(return_value=mock_result)
+
+
+@pytest.fixture
+def scalar_result(sample_contact):
+    # Result of a single-row lookup or UPDATE/DELETE .. RETURNING
+    return ScalarResult(sample_contact)
+
+
+@pytest.mark.asyncio
+async def test_get_contact_by_id(contact_repository, mock_session, user, scalar_result):
+    mock_session.execute = AsyncMock(return_value=scalar_result)
 
     # Call method
     result = await contact_repository.get_contact_by_id(contact_id=1, user=user)
@@ -52,19 +91,8 @@ async def test_get_contact_by_id(contact_repository, mock_session, user):
 
 
 @pytest.mark.asyncio
-async def test_get_contact_by_email(contact_repository, mock_session, user):
-    # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = Contact(
-        id=0,
-        name="John",
-        surname="Doe",
-        email="john@doe.com",
-        phone_number="123",
-        birthday=datetime(2012, 1, 15, 12, 0, 0),
-        user=user,
-    )
-    mock_session.execute = AsyncMock(return_value=mock_result)
+async def test_get_contact_by_email(contact_repository, mock_session, user, scalar_result):
+    mock_session.execute = AsyncMock(return_value=scalar_result)
 
     # Call method
     result = await contact_repository.get_contact_by_email(
@@ -82,21 +110,10 @@ async def test_get_contact_by_email(contact_repository, mock_session, user):
 
 
 @pytest.mark.asyncio
-async def test_get_contacts(contact_repository, mock_session, user):
+async def test_get_contacts(contact_repository, mock_session, user, sample_contact):
     # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [
-        Contact(
-            id=0,
-            name="John",
-            surname="Doe",
-            email="john@doe.com",
-            phone_number="123",
-            birthday=datetime(2012, 1, 15, 12, 0, 0),
-            user=user,
-        )
-    ]
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_result = AsyncScalarResult([sample_contact])
+    mock_session.stream_scalars = AsyncMock(return_value=mock_result)
 
     # Call method
     result = await contact_repository.get_contacts(skip=0, limit=10, user=user)
@@ -108,18 +125,17 @@ async def test_get_contacts(contact_repository, mock_session, user):
 
 @pytest.mark.asyncio
 async def test_update_contact(contact_repository, mock_session, user):
-    # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = Contact(
+    # Setup mock: UPDATE .. RETURNING hands back the updated row
+    mock_result = ScalarResult(Contact(
         id=0,
-        name="John",
+        name="Jane",
         surname="Doe",
-        email="john@doe.com",
+        email="jane@doe.com",
         phone_number="123",
         birthday=datetime(2012, 1, 15, 12, 0, 0),
         address=None,
         user=user,
-    )
+    ))
     mock_session.execute = AsyncMock(return_value=mock_result)
 
     # Call method
@@ -141,23 +157,13 @@ async def test_update_contact(contact_repository, mock_session, user):
     assert result.id == 0
     assert result.name == "Jane"
     assert result.email == "jane@doe.com"
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
 
 
 @pytest.mark.asyncio
-async def test_remove_contact(contact_repository, mock_session, user):
-    # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = Contact(
-        id=0,
-        name="John",
-        surname="Doe",
-        email="john@doe.com",
-        phone_number="123",
-        birthday=datetime(2012, 1, 15, 12, 0, 0),
-        user=user,
-    )
-
-    mock_session.execute = AsyncMock(return_value=mock_result)
+async def test_remove_contact(contact_repository, mock_session, user, scalar_result):
+    mock_session.execute = AsyncMock(return_value=scalar_result)
 
     # Call method
     result = await contact_repository.remove_contact(contact_id=1, user=user)
@@ -167,23 +173,14 @@ async def test_remove_contact(contact_repository, mock_session, user):
     assert result.id == 0
     assert result.name == "John"
     assert result.email == "john@doe.com"
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
 
 
 @pytest.mark.asyncio
-async def test_get_upcoming_birthdays(contact_repository, mock_session, user):
+async def test_get_upcoming_birthdays(contact_repository, mock_session, user, sample_contact):
     # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [
-        Contact(
-            id=0,
-            name="John",
-            surname="Doe",
-            email="john@doe.com",
-            phone_number="123",
-            birthday=datetime(2012, 1, 15, 12, 0, 0),
-            user=user,
-        )
-    ]
+    mock_result = ScalarResult(many=[sample_contact])
     mock_session.execute = AsyncMock(return_value=mock_result)
 
     # Call method
@@ -195,14 +192,53 @@ async def test_get_upcoming_birthdays(contact_repository, mock_session, user):
     assert result[0].surname == "Doe"
 
 
+class NewYearsEve(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2024, 12, 30)
+
+
+@pytest.mark.asyncio
+async def test_get_upcoming_birthdays_wraps_around_new_year(
+    contact_repository, mock_session, user, monkeypatch
+):
+    mock_session.execute = AsyncMock(return_value=ScalarResult(many=[]))
+    monkeypatch.setattr("src.repository.contacts.datetime", NewYearsEve)
+
+    await contact_repository.get_upcoming_birthdays(user=user, days=7)
+
+    compiled = mock_session.execute.await_args.args[0].compile()
+    sql = str(compiled)
+    assert "contact.birthday_md >= " in sql and " OR contact.birthday_md <= " in sql
+    assert {1230, 106} <= set(compiled.params.values())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("days", [365, 400])
+async def test_get_upcoming_birthdays_full_year_skips_filter(
+    contact_repository, mock_session, user, days
+):
+    mock_session.execute = AsyncMock(return_value=ScalarResult(many=[]))
+
+    await contact_repository.get_upcoming_birthdays(user=user, days=days)
+
+    sql = str(mock_session.execute.await_args.args[0].compile())
+    assert "birthday_md" not in sql.split("WHERE", 1)[1]
+
+
 @pytest.mark.asyncio
 async def test_create_contact(contact_repository, mock_session, user):
     # Setup mock
-    mock_session.add.return_value = None
-    mock_session.commit.return_value = None
-    mock_session.refresh = AsyncMock(
-        side_effect=lambda contact: setattr(contact, "id", 0)
-    )
+    mock_result = ScalarResult(Contact(
+        id=0,
+        name="John",
+        surname="Doe",
+        email="john@doe.com",
+        phone_number="123",
+        birthday=date(2012, 1, 15),
+        user_id=user.id,
+    ))
+    mock_session.execute = AsyncMock(return_value=mock_result)
 
     # Call method
     result = await contact_repository.create_contact(
@@ -222,4 +258,7 @@ async def test_create_contact(contact_repository, mock_session, user):
     assert result.id == 0
     assert result.name == "John"
     assert result.email == "john@doe.com"
-    assert result.user_id == user.id
\ No newline at end of file
+    assert result.user_id == user.id
+    assert result.address is None
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
\ No newline at end of file
@@ -0,0 +1,31 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.database.db import DatabaseSessionManager
+
+
+@pytest.fixture
+def manager():
+    manager = DatabaseSessionManager.__new__(DatabaseSessionManager)
+    manager._engine = MagicMock()
+    manager._engine.pool.size.return_value = 3
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_warm_up_closes_opened_connections_when_one_fails(manager, caplog):
+    opened = [AsyncMock(), AsyncMock()]
+    manager._engine.connect = AsyncMock(side_effect=[opened[0], OSError("refused"), opened[1]])
+
+    await manager.warm_up()
+
+    for connection in opened:
+        connection.close.assert_awaited_once()
+    assert "opened 2 of 3 connections" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_warm_up_does_not_raise_when_database_is_down(manager):
+    manager._engine.connect = AsyncMock(side_effect=OSError("refused"))
+
+    await manager.warm_up()
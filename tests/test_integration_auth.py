@@ -1,6 +1,6 @@
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import AsyncMock
 import pytest
-from sqlalchemy import select
+from sqlalchemy import update
 
 from src.database.models import User
 from src.services.auth import create_email_token
@@ -15,10 +15,17 @@ user_data = {
 }
 
 
-def test_register(client, monkeypatch):
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_email", mock_send_email)
-    response = client.post("api/auth/register", json=user_data)
+async def set_confirmed(email: str, confirmed: bool):
+    async with TestingSessionLocal() as session:
+        await session.execute(
+            update(User).where(User.email == email).values(confirmed=confirmed)
+        )
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_register(client):
+    response = await client.post("api/auth/register", json=user_data)
     assert response.status_code == 201, response.text
     data = response.json()
     assert data["username"] == user_data["username"]
@@ -28,28 +35,39 @@ def test_register(client, monkeypatch):
     assert data["role"] == user_data["role"]
 
 
-def test_repeat_signup(client, monkeypatch):
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_email", mock_send_email)
+@pytest.mark.asyncio
+async def test_repeat_signup(client):
     user_data_new = user_data.copy()
     user_data_new["username"] = "new_user"
-    response = client.post("api/auth/register", json=user_data)
+    response = await client.post("api/auth/register", json=user_data_new)
     assert response.status_code == 409, response.text
     data = response.json()
     assert data["detail"] == "A user with this email already exists."
 
 
-def test_signup_failed(client, monkeypatch):
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_email", mock_send_email)
-    response = client.post("api/auth/register", json=user_data)
+@pytest.mark.asyncio
+async def test_signup_failed(client):
+    response = await client.post("api/auth/register", json=user_data)
     assert response.status_code == 409, response.text
     data = response.json()
     assert data["detail"] == "A user with this email already exists."
 
 
-def test_not_confirmed_login(client):
-    response = client.post(
+@pytest.mark.asyncio
+async def test_signup_username_taken(client, mail_senders):
+    mock_send_email = mail_senders["send_email"]
+    user_data_new = user_data.copy()
+    user_data_new["email"] = "new_agent@gmail.com"
+    response = await client.post("api/auth/register", json=user_data_new)
+    assert response.status_code == 409, response.text
+    data = response.json()
+    assert data["detail"] == "A user with this username already exists."
+    mock_send_email.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_not_confirmed_login(client):
+    response = await client.post(
         "api/auth/login",
         data={
             "username": user_data.get("username"),
@@ -61,10 +79,9 @@ def test_not_confirmed_login(client):
     assert data["detail"] == "Email not confirmed. Please confirm your email first."
 
 
-def test_request_email(client, monkeypatch):
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_email", mock_send_email)
-    response = client.post("api/auth/request-email", json={"email": user_data["email"]})
+@pytest.mark.asyncio
+async def test_request_email(client):
+    response = await client.post("api/auth/request-email", json={"email": user_data["email"]})
     assert response.status_code == 200, response.text
     data = response.json()
     assert data["message"] == "Check your email for confirmation link."
@@ -72,16 +89,9 @@ def test_request_email(client, monkeypatch):
 
 @pytest.mark.asyncio
 async def test_login(client):
-    async with TestingSessionLocal() as session:
-        current_user = await session.execute(
-            select(User).where(User.email == user_data.get("email"))
-        )
-        current_user = current_user.scalar_one_or_none()
-        if current_user:
-            current_user.confirmed = True
-            await session.commit()
+    await set_confirmed(user_data["email"], True)
 
-    response = client.post(
+    response = await client.post(
         "api/auth/login",
         data={
             "username": user_data.get("username"),
@@ -95,8 +105,9 @@ async def test_login(client):
     assert "token_type" in data
 
 
-def test_wrong_password_login(client):
-    response = client.post(
+@pytest.mark.asyncio
+async def test_wrong_password_login(client):
+    response = await client.post(
         "api/auth/login",
         data={"username": user_data.get("username"), "password": "password"},
     )
@@ -105,8 +116,9 @@ def test_wrong_password_login(client):
     assert data["detail"] == "Invalid username or password."
 
 
-def test_wrong_username_login(client):
-    response = client.post(
+@pytest.mark.asyncio
+async def test_wrong_username_login(client):
+    response = await client.post(
         "api/auth/login",
         data={"username": "username", "password": user_data.get("password")},
     )
@@ -115,8 +127,9 @@ def test_wrong_username_login(client):
     assert data["detail"] == "Invalid username or password."
 
 
-def test_validation_error_login(client):
-    response = client.post(
+@pytest.mark.asyncio
+async def test_validation_error_login(client):
+    response = await client.post(
         "api/auth/login", data={"password": user_data.get("password")}
     )
     assert response.status_code == 422, response.text
@@ -124,8 +137,9 @@ def test_validation_error_login(client):
     assert "detail" in data
 
 
-def test_refresh_token(client, get_refresh_token):
-    response = client.post(
+@pytest.mark.asyncio
+async def test_refresh_token(client, get_refresh_token):
+    response = await client.post(
         "api/auth/refresh-token",
         json={"refresh_token": get_refresh_token},
         headers={"Authorization": f"Bearer {get_refresh_token}"},
@@ -135,8 +149,9 @@ def test_refresh_token(client, get_refresh_token):
     assert data["detail"] == "Could not validate credentials"
 
 
-def test_invalid_refresh_token(client):
-    response = client.post(
+@pytest.mark.asyncio
+async def test_invalid_refresh_token(client):
+    response = await client.post(
         "api/auth/refresh-token",
         json={"refresh_token": "invalid_token"},
     )
@@ -145,22 +160,33 @@ def test_invalid_refresh_token(client):
     assert data["detail"] == "Could not validate credentials"
 
 
-def test_confirm_email_failed(client, get_email_token):
-    response = client.get(f"api/auth/confirm-email/{get_email_token}")
+@pytest.mark.asyncio
+async def test_refresh_token_missing_field(client):
+    response = await client.post("api/auth/refresh-token", json={})
+    assert response.status_code == 422, response.text
+    data = response.json()
+    assert data["detail"][0]["loc"] == ["body", "refresh_token"]
+
+
+@pytest.mark.asyncio
+async def test_confirm_email_failed(client, get_email_token):
+    response = await client.get(f"api/auth/confirm-email/{get_email_token}")
     assert response.status_code == 200, response.text
     data = response.json()
     assert data["message"] == "Email already confirmed"
 
 
-def test_already_confirmed_email(client, get_email_token):
-    response = client.get(f"api/auth/confirm-email/{get_email_token}")
+@pytest.mark.asyncio
+async def test_already_confirmed_email(client, get_email_token):
+    response = await client.get(f"api/auth/confirm-email/{get_email_token}")
     assert response.status_code == 200, response.text
     data = response.json()
     assert data["message"] == "Email already confirmed"
 
 
-def test_confirm_email_wrong_token(client, get_email_token):
-    response = client.get(f"api/auth/confirm-email/eriqur2341341")
+@pytest.mark.asyncio
+async def test_confirm_email_wrong_token(client, get_email_token):
+    response = await client.get(f"api/auth/confirm-email/eriqur2341341")
     assert response.status_code == 422, response.text
     data = response.json()
     assert data["detail"] == "Invalid token for email verification"
@@ -168,27 +194,18 @@ def test_confirm_email_wrong_token(client, get_email_token):
 
 @pytest.mark.asyncio
 async def test_request_email_confirmed(client):
-    async with TestingSessionLocal() as session:
-        # Retrieve the user and set confirmed to False
-        user = await session.execute(
-            select(User).where(User.email == "agent007@gmail.com")
-        )
-        user = user.scalar_one_or_none()
-        if user:
-            user.confirmed = False
-            await session.commit()
+    await set_confirmed("agent007@gmail.com", False)
 
     # Perform the request
-    response = client.post("api/auth/request-email", json={"email": "agent007@gmail.com"})
+    response = await client.post("api/auth/request-email", json={"email": "agent007@gmail.com"})
     assert response.status_code == 200, response.text
     data = response.json()
     assert data["message"] == "Check your email for confirmation link."
 
 
-def test_request_email_failed(client, monkeypatch):
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_email", mock_send_email)
-    response = client.post(
+@pytest.mark.asyncio
+async def test_request_email_failed(client):
+    response = await client.post(
         "api/auth/request-email", json={"email": "unexisting@test.com"}
     )
     assert response.status_code == 404, response.text
@@ -196,8 +213,9 @@ def test_request_email_failed(client, monkeypatch):
     assert data["detail"] == "User with this email does not exist."
 
 
-def test_logging_on_failed_login(client, caplog):
-    response = client.post(
+@pytest.mark.asyncio
+async def test_logging_on_failed_login(client, caplog):
+    response = await client.post(
         "api/auth/login",
         data={"username": user_data["username"], "password": "wrong_password"},
     )
@@ -205,16 +223,14 @@ def test_logging_on_failed_login(client, caplog):
     assert "Failed login attempt" in caplog.text
 
 
-def test_request_password_reset(client, monkeypatch):
+@pytest.mark.asyncio
+async def test_request_password_reset(client, mail_senders):
     """
     Test the request-password-reset endpoint to ensure that it correctly sends a reset email.
     """
-    mock_send_reset_password_email = Mock()
-    monkeypatch.setattr(
-        "src.api.auth.send_reset_password_email", mock_send_reset_password_email
-    )
+    mock_send_reset_password_email = mail_senders["send_reset_password_email"]
 
-    response = client.post(
+    response = await client.post(
         "api/auth/request-password-reset", json={"email": user_data["email"]}
     )
 
@@ -224,11 +240,12 @@ def test_request_password_reset(client, monkeypatch):
     mock_send_reset_password_email.assert_called_once()
 
 
-def test_request_password_reset_user_not_found(client):
+@pytest.mark.asyncio
+async def test_request_password_reset_user_not_found(client):
     """
     Test the request-password-reset endpoint for a non-existent user.
     """
-    response = client.post(
+    response = await client.post(
         "api/auth/request-password-reset", json={"email": "nonexistent@example.com"}
     )
 
@@ -238,25 +255,16 @@ def test_request_password_reset_user_not_found(client):
 
 
 @pytest.mark.asyncio
-async def test_reset_password_success(client, monkeypatch):
+async def test_reset_password_success(client, mail_senders):
     """
     Test the reset-password endpoint for successful password reset.
     """
-    mock_send_new_password_email = Mock()
-    monkeypatch.setattr(
-        "src.api.auth.send_new_password_email", mock_send_new_password_email
-    )
+    mock_send_new_password_email = mail_senders["send_new_password_email"]
 
-    # Generate a valid token
-    async with TestingSessionLocal() as session:
-        current_user = await session.execute(
-            select(User).where(User.email == user_data.get("email"))
-        )
-        current_user = current_user.scalar_one_or_none()
-        if current_user:
-            token = create_email_token(data={"sub": current_user.email})
+    # Generate a valid token for the registered user
+    token = create_email_token(data={"sub": user_data["email"]})
 
-    response = client.get(f"api/auth/reset-password?token={token}")
+    response = await client.get(f"api/auth/reset-password?token={token}")
     assert response.status_code == 200, response.text
 
     data = response.json()
@@ -269,7 +277,7 @@ async def test_reset_password_invalid_token(client):
     """
     Test the reset-password endpoint with an invalid token.
     """
-    response = client.get("api/auth/reset-password?token=invalid_token")
+    response = await client.get("api/auth/reset-password?token=invalid_token")
     assert response.status_code == 400, response.text
     data = response.json()
     assert data["detail"] == "Invalid or expired token."
@@ -283,7 +291,7 @@ async def test_reset_password_user_not_found(client, monkeypatch):
     mock_get_email_from_token = AsyncMock(return_value="unknown@example.com")
     monkeypatch.setattr("src.api.auth.get_email_from_token", mock_get_email_from_token)
 
-    response = client.get("api/auth/reset-password?token=some_valid_token")
+    response = await client.get("api/auth/reset-password?token=some_valid_token")
     assert response.status_code == 404, response.text
     data = response.json()
     assert data["detail"] == "User not found."
\ No newline at end of file
@@ -1,5 +1,5 @@
 import pytest
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -26,8 +26,9 @@ updated_contact_data = {
 }
 
 
-def test_create_contact(client, get_access_token):
-    response = client.post(
+@pytest.mark.asyncio
+async def test_create_contact(client, get_access_token):
+    response = await client.post(
         "/api/contacts",
         json=contact_data,
         headers={"Authorization": f"Bearer {get_access_token}"},
@@ -40,8 +41,20 @@ def test_create_contact(client, get_access_token):
     assert "id" in data
 
 
-def test_get_contact_by_id(client, get_access_token):
-    response = client.get(
+@pytest.mark.asyncio
+async def test_create_contact_duplicate_email(client, get_access_token):
+    response = await client.post(
+        "/api/contacts",
+        json=contact_data,
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    assert response.status_code == 409, response.text
+    assert response.json()["detail"] == "Contact with this email already exists"
+
+
+@pytest.mark.asyncio
+async def test_get_contact_by_id(client, get_access_token):
+    response = await client.get(
         "/api/contacts/1", headers={"Authorization": f"Bearer {get_access_token}"}
     )
     assert response.status_code == 200, response.text
@@ -50,8 +63,88 @@ def test_get_contact_by_id(client, get_access_token):
     assert "id" in data
 
 
-def test_get_contact_not_found(client, get_access_token):
-    response = client.get(
+@pytest.mark.asyncio
+async def test_contact_with_address(client, get_access_token):
+    headers = {"Authorization": f"Bearer {get_access_token}"}
+    address = {
+        "country": "Ukraine",
+        "index": 1001,
+        "city": "Kyiv",
+        "street": "Khreshchatyk",
+        "house": "1",
+        "apartment": "2",
+    }
+    response = await client.post(
+        "/api/contacts",
+        json={**contact_data, "email": "with.address@example.com", "address": address},
+        headers=headers,
+    )
+    assert response.status_code == 201, response.text
+    contact = response.json()
+    assert contact["address"]["city"] == "Kyiv"
+
+    response = await client.get(f"/api/contacts/{contact['id']}", headers=headers)
+    assert response.json()["address"]["street"] == "Khreshchatyk"
+
+    response = await client.delete(f"/api/contacts/{contact['id']}", headers=headers)
+    assert response.status_code == 204, response.text
+
+
+@pytest.mark.asyncio
+async def test_update_contact_address(client, get_access_token):
+    headers = {"Authorization": f"Bearer {get_access_token}"}
+    body = {**contact_data, "email": "moving@example.com"}
+    response = await client.post("/api/contacts", json=body, headers=headers)
+    contact_id = response.json()["id"]
+    address = {
+        "country": "Ukraine",
+        "index": 79000,
+        "city": "Lviv",
+        "street": "Rynok",
+        "house": "10",
+        "apartment": "5",
+    }
+
+    # No address yet: one is created and linked
+    response = await client.put(
+        f"/api/contacts/{contact_id}", json={**body, "address": address}, headers=headers
+    )
+    assert response.status_code == 200, response.text
+    address_id = response.json()["address"]["id"]
+
+    # Linked address: updated in place
+    response = await client.put(
+        f"/api/contacts/{contact_id}",
+        json={**body, "address": {**address, "city": "Odesa"}},
+        headers=headers,
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["address"] == {**address, "city": "Odesa", "id": address_id}
+
+    response = await client.get(f"/api/contacts/{contact_id}", headers=headers)
+    assert response.json()["address"]["city"] == "Odesa"
+
+    response = await client.delete(f"/api/contacts/{contact_id}", headers=headers)
+    assert response.status_code == 204, response.text
+
+
+@pytest.mark.asyncio
+async def test_get_contact_not_modified(client, get_access_token):
+    headers = {"Authorization": f"Bearer {get_access_token}"}
+    response = await client.get("/api/contacts/1", headers=headers)
+    etag = response.headers["ETag"]
+
+    response = await client.get(
+        "/api/contacts/1", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 304, response.text
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_get_contact_not_found(client, get_access_token):
+    response = await client.get(
         "/api/contacts/2", headers={"Authorization": f"Bearer {get_access_token}"}
     )
     assert response.status_code == 404, response.text
@@ -59,8 +152,9 @@ def test_get_contact_not_found(client, get_access_token):
     assert data["detail"] == "Contact with ID 2 not found"
 
 
-def test_get_contacts(client, get_access_token):
-    response = client.get(
+@pytest.mark.asyncio
+async def test_get_contacts(client, get_access_token):
+    response = await client.get(
         "/api/contacts", headers={"Authorization": f"Bearer {get_access_token}"}
     )
     assert response.status_code == 200, response.text
@@ -70,8 +164,52 @@ def test_get_contacts(client, get_access_token):
     assert "id" in data[0]
 
 
-def test_update_contact(client, get_access_token):
-    response = client.put(
+@pytest.mark.asyncio
+async def test_get_contacts_single_contact_query(client, get_access_token, query_counter):
+    response = await client.get(
+        "/api/contacts", headers={"Authorization": f"Bearer {get_access_token}"}
+    )
+    assert response.status_code == 200, response.text
+    contact_queries = [s for s in query_counter if "FROM contact" in s]
+    assert len(contact_queries) == 1
+
+
+@pytest.mark.asyncio
+async def test_search_contacts(client, get_access_token):
+    headers = {"Authorization": f"Bearer {get_access_token}"}
+
+    response = await client.get("/api/contacts", params={"q": "doe"}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert [contact["name"] for contact in response.json()] == ["John"]
+
+    response = await client.get("/api/contacts", params={"q": "nobody"}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_get_contacts_after_cursor(client, get_access_token):
+    headers = {"Authorization": f"Bearer {get_access_token}"}
+
+    response = await client.get(
+        "/api/contacts", params={"after_surname": "A", "after_id": 0}, headers=headers
+    )
+    assert response.status_code == 200, response.text
+    assert [contact["name"] for contact in response.json()] == ["John"]
+
+    response = await client.get(
+        "/api/contacts", params={"after_surname": "Doe", "after_id": 1}, headers=headers
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == []
+
+    response = await client.get("/api/contacts", params={"after_id": 1}, headers=headers)
+    assert response.status_code == 422, response.text
+
+
+@pytest.mark.asyncio
+async def test_update_contact(client, get_access_token):
+    response = await client.put(
         "/api/contacts/1",
         json=updated_contact_data,
         headers={"Authorization": f"Bearer {get_access_token}"},
@@ -84,8 +222,9 @@ def test_update_contact(client, get_access_token):
     assert "id" in data
 
 
-def test_update_contact_unprodessable(client, get_access_token):
-    response = client.put(
+@pytest.mark.asyncio
+async def test_update_contact_unprodessable(client, get_access_token):
+    response = await client.put(
         "/api/contacts/1",
         json={"name": "Michael"},
         headers={"Authorization": f"Bearer {get_access_token}"},
@@ -93,8 +232,9 @@ def test_update_contact_unprodessable(client, get_access_token):
     assert response.status_code == 422, response.text
 
 
-def test_update_contact_not_found(client, get_access_token):
-    response = client.put(
+@pytest.mark.asyncio
+async def test_update_contact_not_found(client, get_access_token):
+    response = await client.put(
         "/api/contacts/2",
         json=updated_contact_data,
         headers={"Authorization": f"Bearer {get_access_token}"},
@@ -104,8 +244,9 @@ def test_update_contact_not_found(client, get_access_token):
     assert data["detail"] == "Contact with ID 2 not found"
 
 
-def test_read_bistdays(client, get_access_token):
-    response = client.get(
+@pytest.mark.asyncio
+async def test_read_bistdays(client, get_access_token):
+    response = await client.get(
         "/api/contacts/birthdays/upcoming",
         headers={"Authorization": f"Bearer {get_access_token}"},
     )
@@ -119,15 +260,40 @@ def test_read_bistdays(client, get_access_token):
     assert data[0]["address"] is None
 
 
-def test_delete_contact(client, get_access_token):
-    response = client.delete(
+@pytest.mark.asyncio
+async def test_read_birthdays_across_new_year(client, get_access_token, monkeypatch):
+    class NewYearsEve(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls(2024, 12, 30)
+
+    headers = {"Authorization": f"Bearer {get_access_token}"}
+    response = await client.post(
+        "/api/contacts",
+        json={**contact_data, "email": "new.year@example.com", "birthday": "2000-01-02"},
+        headers=headers,
+    )
+    contact_id = response.json()["id"]
+    monkeypatch.setattr("src.repository.contacts.datetime", NewYearsEve)
+
+    response = await client.get("/api/contacts/birthdays/upcoming", headers=headers)
+    await client.delete(f"/api/contacts/{contact_id}", headers=headers)
+
+    assert response.status_code == 200, response.text
+    assert [contact["birthday"] for contact in response.json()] == ["2000-01-02"]
+
+
+@pytest.mark.asyncio
+async def test_delete_contact(client, get_access_token):
+    response = await client.delete(
         "/api/contacts/1", headers={"Authorization": f"Bearer {get_access_token}"}
     )
     assert response.status_code == 204, response.text
 
 
-def test_delete_contact_not_found(client, get_access_token):
-    response = client.delete(
+@pytest.mark.asyncio
+async def test_delete_contact_not_found(client, get_access_token):
+    response = await client.delete(
         "/api/contacts/1", headers={"Authorization": f"Bearer {get_access_token}"}
     )
     assert response.status_code == 404, response.text
@@ -135,8 +301,9 @@ def test_delete_contact_not_found(client, get_access_token):
     assert data["detail"] == "Contact with ID 1 not found"
 
 
-def test_read_bistdays_empty(client, get_access_token):
-    response = client.get(
+@pytest.mark.asyncio
+async def test_read_bistdays_empty(client, get_access_token):
+    response = await client.get(
         "/api/contacts/birthdays/upcoming",
         headers={"Authorization": f"Bearer {get_access_token}"},
         params={"daygap": 1},
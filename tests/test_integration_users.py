@@ -1,11 +1,13 @@
 from unittest.mock import patch
-from conftest import test_user
+import pytest
+from tests.conftest import test_user
 
 
-def test_get_me(client, get_access_token):
+@pytest.mark.asyncio
+async def test_get_me(client, get_access_token):
     token = get_access_token
     headers = {"Authorization": f"Bearer {token}"}
-    response = client.get("api/users/me", headers=headers)
+    response = await client.get("api/users/me", headers=headers)
 
     assert response.status_code == 200, response.text
     data = response.json()
@@ -14,8 +16,9 @@ def test_get_me(client, get_access_token):
     assert "avatar" in data
 
 
-@patch("src.services.upload_file.UploadFileService.upload_file")
-def test_update_avatar_user(mock_upload_file, client, get_access_token):
+@pytest.mark.asyncio
+@patch("src.services.upload_file.UploadFileService.upload_file_async")
+async def test_update_avatar_user(mock_upload_file, client, get_access_token):
     fake_url = "<http://example.com/avatar.jpg>"
     mock_upload_file.return_value = fake_url
 
@@ -24,7 +27,7 @@ def test_update_avatar_user(mock_upload_file, client, get_access_token):
     # Mock file upload
     file_data = {"file": ("avatar.jpg", b"fake image content", "image/jpeg")}
 
-    response = client.patch("/api/users/avatar", headers=headers, files=file_data)
+    response = await client.patch("/api/users/avatar", headers=headers, files=file_data)
 
     assert response.status_code == 403, response.text
     data = response.json()
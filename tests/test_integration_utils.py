@@ -1,13 +1,17 @@
+import time
 from unittest.mock import AsyncMock, patch
 import pytest
 
+from main import app
+from src.database.db import get_db
+
 
 @pytest.mark.asyncio
 async def test_healthchecker_success(client):
     mock_db = AsyncMock()
     mock_db.execute.return_value.scalar_one_or_none.return_value = 1
     with patch("src.api.utils.get_db", return_value=mock_db):
-        response = client.get("api/healthchecker")
+        response = await client.get("api/healthchecker")
         assert response.status_code == 200
         data = response.json()
         assert data == {"message": "Welcome to FastAPI!"}
@@ -28,4 +32,21 @@ async def test_healthchecker_db_connection_error(client):
     mock_db.execute.side_effect = Exception("Error connecting to the database")
     with patch("src.api.utils.get_db", return_value=mock_db):
         with pytest.raises(Exception):
-            await client()
\ No newline at end of file
+            await client()
+
+
+@pytest.mark.asyncio
+async def test_healthchecker_skips_query_after_recent_ping(client, monkeypatch):
+    mock_db = AsyncMock()
+    mock_db.execute.side_effect = Exception("Error connecting to the database")
+
+    async def override_get_db():
+        yield mock_db
+
+    monkeypatch.setattr("src.api.utils._last_ping", time.monotonic())
+    monkeypatch.setitem(app.dependency_overrides, get_db, override_get_db)
+
+    response = await client.get("api/healthchecker")
+
+    assert response.status_code == 200
+    mock_db.execute.assert_not_awaited()
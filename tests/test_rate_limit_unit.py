@@ -0,0 +1,85 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.services.rate_limit import RateLimiter, RateLimitExceeded
+
+
+@pytest.fixture
+def request_mock():
+    request = MagicMock()
+    request.url.path = "/api/users/me"
+    request.client.host = "127.0.0.1"
+    return request
+
+
+@pytest.fixture
+def redis_client():
+    client = MagicMock()
+    client.register_script.return_value = AsyncMock(return_value=1)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_local_bucket_answers_without_redis(request_mock, redis_client):
+    limiter = RateLimiter(times=10, seconds=60)
+
+    await limiter(request_mock, redis_client)
+    await limiter(request_mock, redis_client)
+
+    # Only the first hit is reconciled, the second stays local
+    script = redis_client.register_script.return_value
+    assert script.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_local_limit_rejects_without_redis(request_mock, redis_client):
+    limiter = RateLimiter(times=2, seconds=60)
+
+    await limiter(request_mock, redis_client)
+    await limiter(request_mock, redis_client)
+    script = redis_client.register_script.return_value
+    calls = script.await_count
+
+    with pytest.raises(RateLimitExceeded):
+        await limiter(request_mock, redis_client)
+    assert script.await_count == calls
+
+
+@pytest.mark.asyncio
+async def test_shared_count_over_limit_rejects(request_mock, redis_client):
+    redis_client.register_script.return_value = AsyncMock(return_value=11)
+    limiter = RateLimiter(times=10, seconds=60)
+
+    with pytest.raises(RateLimitExceeded):
+        await limiter(request_mock, redis_client)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("host, expected", [("10.0.0.1", "10.0.0.1"), (None, "127.0.0.1")])
+async def test_key_uses_client_host_or_default(request_mock, redis_client, host, expected):
+    if host is None:
+        request_mock.client = None
+    else:
+        request_mock.client.host = host
+    limiter = RateLimiter(times=10, seconds=60)
+
+    await limiter(request_mock, redis_client)
+
+    script = redis_client.register_script.return_value
+    assert script.await_args.kwargs["keys"] == [f"rate_limit:/api/users/me:{expected}"]
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_bucket_is_evicted(request_mock, redis_client):
+    limiter = RateLimiter(times=10, seconds=60, max_keys=2)
+
+    for host in ("10.0.0.1", "10.0.0.2", "10.0.0.1", "10.0.0.3"):
+        request_mock.client.host = host
+        await limiter(request_mock, redis_client)
+
+    assert list(limiter._buckets) == [
+        "rate_limit:/api/users/me:10.0.0.1",
+        "rate_limit:/api/users/me:10.0.0.3",
+    ]
+    assert set(limiter._last_sync) <= set(limiter._buckets)
+    assert set(limiter._pending) <= set(limiter._buckets)
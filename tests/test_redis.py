@@ -1,17 +1,19 @@
+import fakeredis
 import pytest
 import redis.asyncio as redis
 from fastapi import FastAPI
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
+import src.redis
 from src.redis import get_redis, init_redis, close_redis
 
 
 @pytest.fixture
-def mock_redis_client():
+def fake_redis_client():
     """
-    Mock Redis client for testing.
+    In-memory Redis client with the real async API.
     """
-    return AsyncMock()
+    return fakeredis.FakeAsyncRedis()
 
 
 @pytest.fixture
@@ -35,32 +37,29 @@ async def test_get_redis_not_initialized():
 
 
 @pytest.mark.asyncio
-async def test_get_redis_initialized(mock_redis_client):
+async def test_get_redis_initialized(fake_redis_client):
     """
     Test get_redis returns the Redis client when initialized.
     """
-    # Mock global Redis client
-    with patch("src.redis.redis_client", mock_redis_client):
+    with patch("src.redis.redis_client", fake_redis_client):
         client = await get_redis()
-        assert client == mock_redis_client
+        assert client is fake_redis_client
 
 
 @pytest.mark.asyncio
 @patch("src.redis.redis.from_url")
-async def test_init_redis_success(mock_from_url, app, mock_redis_client):
+async def test_init_redis_success(mock_from_url, app, fake_redis_client):
     """
     Test init_redis initializes Redis successfully.
     """
-    # Mock Redis client behavior
-    mock_from_url.return_value = mock_redis_client
-    mock_redis_client.ping.return_value = True
+    mock_from_url.return_value = fake_redis_client
 
-    await init_redis(app)
+    with patch("src.redis.redis_client", None):
+        await init_redis(app)
 
     # Assertions
     mock_from_url.assert_called_once_with(app.state.redis_url)
-    mock_redis_client.ping.assert_awaited_once()
-    assert app.state.redis_client == mock_redis_client
+    assert app.state.redis_client is fake_redis_client
 
 
 @pytest.mark.asyncio
@@ -87,14 +86,12 @@ async def test_close_redis_not_initialized():
 
 
 @pytest.mark.asyncio
-async def test_close_redis_initialized(mock_redis_client):
+async def test_close_redis_initialized(fake_redis_client):
     """
     Test close_redis closes the Redis connection when initialized.
     """
-    # Mock global Redis client
-    with patch("src.redis.redis_client", mock_redis_client):
+    with patch("src.redis.redis_client", fake_redis_client):
         await close_redis()
 
         # Assertions
-        mock_redis_client.close.assert_awaited_once()
-        assert mock_redis_client is not None
+        assert src.redis.redis_client is None
@@ -0,0 +1,44 @@
+import httpx
+import pytest
+
+from src.services.upload_file import UploadFileService
+
+
+@pytest.fixture
+def upload_service():
+    return UploadFileService("cloud", "key", "secret")
+
+
+@pytest.fixture
+def avatar():
+    return b"fake image content"
+
+
+@pytest.mark.asyncio
+async def test_upload_file_async(upload_service, avatar):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"version": 123})
+
+    upload_service.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    url = await upload_service.upload_file_async(avatar, "testuser", "image/jpeg")
+
+    assert "RestApp/testuser" in url
+    assert "v123" in url
+    assert str(requests[0].url) == "https://api.cloudinary.com/v1_1/cloud/image/upload"
+    body = requests[0].content
+    assert b"fake image content" in body
+    assert b'name="signature"' in body
+
+
+@pytest.mark.asyncio
+async def test_upload_file_async_failure(upload_service, avatar):
+    upload_service.http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(401))
+    )
+
+    with pytest.raises(RuntimeError):
+        await upload_service.upload_file_async(avatar, "testuser")
@@ -80,6 +80,23 @@ async def test_get_user_by_email(mock_user_repository, mock_session, user):
     assert result.avatar == "avatar"
 
 
+@pytest.mark.asyncio
+async def test_get_users_by_email_or_username(mock_user_repository, mock_session, user):
+    # Setup mock
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = [user]
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    # Call method
+    result = await mock_user_repository.get_users_by_email_or_username(
+        email="test@email.com", username="other"
+    )
+
+    # Assertions
+    assert result == [user]
+    mock_session.execute.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_create_user(mock_user_repository, mock_session):
     user_data = UserCreate(
@@ -102,6 +119,8 @@ async def test_create_user(mock_user_repository, mock_session):
 
 @pytest.mark.asyncio
 async def test_update_avatar_url(mock_user_repository, mock_session, user):
+    # UPDATE .. RETURNING hands back the updated row
+    user.avatar = "new_avatar_url"
     mock_result = MagicMock()
     mock_result.scalar_one_or_none.return_value = user
     mock_session.execute = AsyncMock(return_value=mock_result)
@@ -111,6 +130,8 @@ async def test_update_avatar_url(mock_user_repository, mock_session, user):
     )
 
     assert user.avatar == "new_avatar_url"
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -122,4 +143,55 @@ async def test_update_avatar_url_with_no_user(mock_user_repository, mock_session
     with pytest.raises(ValueError):
         await mock_user_repository.update_avatar_url(
             email="test@example.com", url="new_avatar_url"
-        )
\ No newline at end of file
+        )
+
+
+@pytest.mark.asyncio
+async def test_update_password_by_email(mock_user_repository, mock_session):
+    mock_result = MagicMock()
+    mock_result.first.return_value = (1,)
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    await mock_user_repository.update_password_by_email("test@example.com", "hashed")
+
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_update_password_by_email_with_no_user(mock_user_repository, mock_session):
+    mock_result = MagicMock()
+    mock_result.first.return_value = None
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    with pytest.raises(ValueError):
+        await mock_user_repository.update_password_by_email("test@example.com", "hashed")
+    mock_session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_confirmed_email(mock_user_repository, mock_session):
+    await mock_user_repository.confirmed_email("test@example.com")
+
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_user_auth_projection(mock_user_repository, mock_session):
+    mock_result = MagicMock()
+    mock_result.one_or_none.return_value._mapping = {
+        "id": 1,
+        "username": "test",
+        "email": "test@example.com",
+        "avatar": "avatar",
+        "role": UserRole.USER,
+    }
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    user = await mock_user_repository.get_user_auth_projection("test")
+
+    assert user.id == 1
+    assert user.username == "test"
+    assert user.role == UserRole.USER
+    assert user.hashed_password is None